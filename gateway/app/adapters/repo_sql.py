@@ -1,24 +1,37 @@
 from typing import Optional, Dict, Any, List
+from sqlalchemy import inspect, update as sa_update
 from sqlalchemy.orm import Session
 from gateway.ports.repository import ITaskRepository
 from gateway.app.models import Task
 
+_TASK_COLUMN_KEYS = frozenset(attr.key for attr in inspect(Task).column_attrs)
+
+
+def update_task_fields(session: Session, task_id: str, fields: Dict[str, Any]) -> int:
+    """用 Core UPDATE 只写入传入的字段（跳过 ORM 脏检查），返回受影响行数。"""
+    values = {key: value for key, value in fields.items() if key in _TASK_COLUMN_KEYS}
+    if not values:
+        return 0
+    result = session.execute(
+        sa_update(Task)
+        .where(Task.id == task_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+    return result.rowcount
+
+
 class SQLAlchemyTaskRepository(ITaskRepository):
     def __init__(self, session: Session):
         self.session = session
 
     def get(self, task_id: str) -> Optional[Task]:
-        return self.session.query(Task).filter(Task.id == task_id).first()
+        return self.session.get(Task, task_id)
 
     def update(self, task_id: str, updates: Dict[str, Any]) -> Task:
-        task = self.get(task_id)
-        if task:
-            for key, value in updates.items():
-                if hasattr(task, key):
-                    setattr(task, key, value)
-            self.session.commit()
-            self.session.refresh(task)
-        return task
+        update_task_fields(self.session, task_id, updates)
+        return self.get(task_id)
 
     def create(self, task: Task) -> Task:
         self.session.add(task)
@@ -1,6 +1,11 @@
 import os
-import shutil
 from gateway.app.ports.storage import IStorageService
+from gateway.app.utils.files import fast_copy
+
+
+def _same_file(src: str, dst: str) -> bool:
+    return os.path.exists(dst) and os.path.samefile(src, dst)
+
 
 class LocalStorageService(IStorageService):
     def __init__(self, root_dir: str):
@@ -26,8 +31,10 @@ class LocalStorageService(IStorageService):
         if directory:
             os.makedirs(directory, exist_ok=True)
         
-        # 复制文件
-        shutil.copy2(local_path, dest_path)
+        # 复制文件内容（copy_file_range：同一文件系统上可走 reflink）
+        # 存储根目录与 workspace 可能是同一目录：文件已在目标位置时无需复制
+        if not _same_file(local_path, dest_path):
+            fast_copy(local_path, dest_path)
         
         # 返回一个本地文件协议路径
         return f"file://{os.path.abspath(dest_path)}"
@@ -46,7 +53,8 @@ class LocalStorageService(IStorageService):
             os.makedirs(directory, exist_ok=True)
         # =================
         
-        shutil.copy2(src_path, local_path)
+        if not _same_file(src_path, local_path):
+            fast_copy(src_path, local_path)
 
     def exists(self, remote_key: str) -> bool:
         path = os.path.join(self.root_dir, remote_key)
@@ -1,8 +1,21 @@
 import boto3
 import mimetypes
+from boto3.s3.transfer import TransferConfig
 from gateway.adapters.r2_s3_client import get_s3_client
 from gateway.app.ports.storage import IStorageService
 
+# S3 needs >= 5 MiB for every part but the last.
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+# File uploads/downloads (raw video, pack zips) go multipart; parts retry
+# individually.
+FILE_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_PART_SIZE,
+    multipart_chunksize=MULTIPART_PART_SIZE,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+
 class R2StorageService(IStorageService):
     def __init__(
         self,
@@ -59,11 +72,14 @@ class R2StorageService(IStorageService):
             self.bucket_name,
             key,
             ExtraArgs={"ContentType": content_type},
+            Config=FILE_TRANSFER_CONFIG,
         )
         return key
 
     def download_file(self, key: str, destination_path: str) -> None:
-        self.s3_client.download_file(self.bucket_name, key, destination_path)
+        self.s3_client.download_file(
+            self.bucket_name, key, destination_path, Config=FILE_TRANSFER_CONFIG
+        )
 
     def exists(self, key: str) -> bool:
         try:
@@ -0,0 +1,64 @@
+"""Shared ``httpx.AsyncClient`` for outbound provider calls.
+
+Clients are bound to the event loop that created them, so one pooled client is
+kept per running loop (the API loop, a pipeline worker loop, ...). Reusing it
+amortizes DNS/TCP/TLS setup across parse, download and other provider calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_clients_lock = threading.Lock()
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _build_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=_env_int("HTTP_MAX_CONNECTIONS", 100),
+        max_keepalive_connections=_env_int("HTTP_MAX_KEEPALIVE_CONNECTIONS", 50),
+    )
+    timeout = httpx.Timeout(float(_env_int("HTTP_TIMEOUT_SEC", 30)))
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled client for the current event loop, creating it lazily."""
+
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = _build_client()
+            _clients[loop] = client
+        return client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client of the current event loop, if any."""
+
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import json
-import zipfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from gateway.app.utils.archive import open_media_zip, zip_tree
+
 
 def _ensure_parent(p: Path) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -85,12 +86,8 @@ def zip_youcut_pack(pack_root: Path, zip_path: Optional[Path] = None) -> Path:
     zip_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Create zip with relative paths: task_id/...
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for p in pack_root.rglob("*"):
-            if p.is_dir():
-                continue
-            rel_inside_pack = p.relative_to(pack_root)
-            arcname = Path(task_id) / rel_inside_pack
-            zf.write(p, arcname.as_posix())
+    # Media entries are stored and text deflates at level 1 (see utils.archive).
+    with open_media_zip(zip_path) as zf:
+        zip_tree(zf, pack_root, task_id)
 
     return zip_path
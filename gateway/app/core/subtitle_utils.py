@@ -5,6 +5,7 @@ services/subtitles.py <-> services/subtitles_openai.py 的循环导入。
 这个模块只包含轻量工具，不依赖服务或路由。
 """
 
+from functools import lru_cache
 from typing import Iterable, List
 
 
@@ -32,6 +33,24 @@ def segments_to_srt(segments: Iterable[dict], text_key: str = "origin") -> str:
     return "\n".join(lines).strip() + "\n" if lines else ""
 
 
+@lru_cache(maxsize=64)
+def srt_to_txt(srt_text: str) -> str:
+    """Flatten SRT text to one plain line per cue (the mm.txt format)."""
+
+    # Any time line contains "-->", so the substring test alone drops it; a
+    # time regex (or a block regex over the whole text) only adds cost here.
+    lines_out: list[str] = []
+    for block in srt_text.split("\n\n"):
+        text_lines: list[str] = []
+        for line in block.splitlines():
+            s = line.strip()
+            if s and "-->" not in s and not s.isdigit():
+                text_lines.append(s)
+        if text_lines:
+            lines_out.append(" ".join(text_lines))
+    return "\n".join(lines_out).strip() + ("\n" if lines_out else "")
+
+
 def preview_lines(text: str, limit: int = 5) -> List[str]:
     """Return first non-empty text lines excluding SRT indices/timestamps.
 
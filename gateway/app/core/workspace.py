@@ -1,8 +1,10 @@
-import json
-import shutil
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from gateway.app.config import get_settings
+from gateway.app.utils.files import fast_copy
+from gateway.app.utils.json_bytes import dumps_pretty
 
 
 def task_base_dir(task_id: str) -> Path:
@@ -161,6 +163,42 @@ class Workspace:
             or self.mm_audio_legacy_path.exists()
         )
 
+    def snapshot(self, *subdirs: str) -> set[str]:
+        """Names present under the given task subdirs, as ``"<subdir>/<name>"``.
+
+        One ``scandir`` per directory replaces a chain of ``exists()`` probes.
+        """
+
+        base = self.base_dir
+        present: set[str] = set()
+        for sub in subdirs:
+            try:
+                with os.scandir(base / sub) as entries:
+                    present.update(f"{sub}/{entry.name}" for entry in entries)
+            except FileNotFoundError:
+                continue
+        return present
+
+    def mm_srt_path_in(self, present: set[str]) -> Path | None:
+        """Resolve the translated SRT (mm, then my) from a ``snapshot("subs")`` result."""
+
+        for lang in ("mm", "my"):
+            if f"subs/{lang}.srt" in present:
+                return subs_dir(self.task_id) / f"{lang}.srt"
+        return None
+
+    def mm_audio_path_in(self, present: set[str]) -> Path | None:
+        """Resolve the dubbed audio file from a ``snapshot("audio")`` result."""
+
+        for path in (
+            self.mm_audio_primary_path,
+            self.mm_audio_mp3_path,
+            self.mm_audio_legacy_path,
+        ):
+            if f"audio/{path.name}" in present:
+                return path
+        return None
+
     def write_mm_audio(self, content: bytes, suffix: str = "wav") -> Path:
         audio_dir(self.task_id).mkdir(parents=True, exist_ok=True)
         suffix = suffix.lstrip(".") or "wav"
@@ -176,23 +214,25 @@ class Workspace:
         return "audio/wav"
 
     def write_segments_json(self, data: dict) -> None:
-        self.segments_json.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        self.segments_json.write_bytes(dumps_pretty(data))
         # scenes 文件用于向后兼容（如果下游读取该名称）。
         scenes = {"scenes": data.get("scenes", [])}
-        self.scenes_json.write_text(
-            json.dumps(scenes, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        self.scenes_json.write_bytes(dumps_pretty(scenes))
 
 
-def workspace_root() -> Path:
-    root = Path(get_settings().workspace_root).expanduser().resolve()
+@lru_cache(maxsize=8)
+def _resolve_workspace_root(configured: str) -> Path:
+    root = Path(configured).expanduser().resolve()
     root.mkdir(parents=True, exist_ok=True)
     return root
 
 
+def workspace_root() -> Path:
+    """Resolved workspace root; resolve()/mkdir run once per configured value."""
+
+    return _resolve_workspace_root(str(get_settings().workspace_root))
+
+
 def raw_path(task_id: str) -> Path:
     path = task_base_dir(task_id) / "raw" / "raw.mp4"
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -244,7 +284,7 @@ def public_audio_dir() -> Path:
 def ensure_public_audio(path: Path) -> Path:
     target = public_audio_dir() / path.name
     if path.exists() and not target.exists():
-        shutil.copy2(path, target)
+        fast_copy(path, target)
     return target
 
 
@@ -260,6 +300,12 @@ def tmp_dir() -> Path:
     return path
 
 
+def mp3_cache_dir() -> Path:
+    path = workspace_root() / "cache" / "mp3"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def audio_wav_path(task_id: str) -> Path:
     path = subs_dir(task_id) / f"{task_id}.wav"
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -305,7 +351,8 @@ def relative_to_workspace(path: Path) -> str:
 
 
 def relative_to_task_workspace(path: Path, task_id: str) -> str:
+    # Only a path computation: no need to mkdir the task dir via task_base_dir.
     try:
-        return str(path.resolve().relative_to(task_base_dir(task_id)))
+        return str(path.resolve().relative_to(workspace_root() / "tasks" / task_id))
     except ValueError:
         return str(path)
@@ -99,6 +99,12 @@ def ensure_task_extra_columns(engine) -> None:
         alter_statements.append("ALTER TABLE tasks ADD COLUMN pack_type VARCHAR(32)")
     if "pack_status" not in columns:
         alter_statements.append("ALTER TABLE tasks ADD COLUMN pack_status VARCHAR(32)")
+    if "pack_sha256" not in columns:
+        alter_statements.append("ALTER TABLE tasks ADD COLUMN pack_sha256 VARCHAR(64)")
+    if "pack_sha256_stamp" not in columns:
+        alter_statements.append("ALTER TABLE tasks ADD COLUMN pack_sha256_stamp VARCHAR(64)")
+    if "pack_error" not in columns:
+        alter_statements.append("ALTER TABLE tasks ADD COLUMN pack_error TEXT")
     if "mm_audio_key" not in columns:
         alter_statements.append("ALTER TABLE tasks ADD COLUMN mm_audio_key TEXT")
     if "subtitle_structure_path" not in columns:
@@ -14,10 +14,12 @@ from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
 from gateway.app.config import create_storage_service, get_settings
+from gateway.app.core.http_client import close_http_client
 from gateway.app.core.logging_config import configure_logging
 from gateway.app.db import Base, SessionLocal, engine, ensure_provider_config_table, ensure_task_extra_columns
 from gateway.app import models
 from gateway.app.ports.storage_provider import get_storage_service, set_storage_service
+from gateway.app.providers.registry import get_cached_tool_handlers
 from gateway.app.routers import admin_publish, publish as publish_router, tasks as tasks_router
 from gateway.app.routes.v17_pack import router as v17_pack_router
 from gateway.routes import v1_actions
@@ -47,6 +49,8 @@ def on_startup() -> None:
     ensure_task_extra_columns(engine)
     ensure_provider_config_table(engine)
     set_storage_service(create_storage_service())
+    # Resolve provider handlers once so background pipelines start warm.
+    get_cached_tool_handlers(engine, get_settings())
     for d in (Path("scenes"), Path("scene_packs"), Path("deliver/packs"), AUDIO_DIR):
         d.mkdir(parents=True, exist_ok=True)
 
@@ -59,6 +63,11 @@ def log_routes_on_startup() -> None:
         name = getattr(route, "name", "")
         logger.info("route=%s methods=%s name=%s", path, methods, name)
 
+
+@app.on_event("shutdown")
+async def on_shutdown_http_client() -> None:
+    await close_http_client()
+
 app.include_router(tasks_router.pages_router)
 app.include_router(tasks_router.api_router)
 app.include_router(v1_actions.router, prefix="/v1")
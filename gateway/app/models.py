@@ -49,6 +49,9 @@ class Task(Base):
     pack_key = Column(Text, nullable=True)
     pack_type = Column(String(32), nullable=True)
     pack_status = Column(String(32), nullable=True)
+    pack_sha256 = Column(String(64), nullable=True)
+    pack_sha256_stamp = Column(String(64), nullable=True)  # "<size>:<mtime_ns>" of the hashed zip
+    pack_error = Column(Text, nullable=True)
     scenes_key = Column(Text, nullable=True)
     scenes_status = Column(String(32), nullable=True)
     scenes_count = Column(Integer, nullable=True)
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import copy
+import os
+import threading
+import time
 from typing import Any, Dict
 
 from gateway.app.config import get_settings
@@ -52,26 +56,110 @@ def resolve_tool_providers(db_engine=engine, settings=None) -> Dict[str, Any]:
     return {"tools": tools}
 
 
+_tool_providers_lock = threading.Lock()
+_tool_providers_cache: Dict[
+    tuple[int, int], tuple[float, tuple[Any, Any], Dict[str, Any], Dict[str, Any]]
+] = {}
+
+
+def _tool_providers_ttl_sec() -> float:
+    try:
+        return float(os.getenv("TOOL_PROVIDERS_CACHE_TTL_SEC", "30"))
+    except ValueError:
+        return 30.0
+
+
+def resolve_tool_handlers(resolved: Dict[str, Any], settings=None) -> Dict[str, Any]:
+    """Map each pipeline tool to the step handler of its configured provider.
+
+    Tools whose provider has no handler are left out; the pipeline reports
+    them as unknown providers when it reaches that step.
+    """
+    defaults = default_providers(settings)
+    tools = resolved.get("tools", {})
+    handlers: Dict[str, Any] = {}
+    for tool, tool_map in PROVIDER_HANDLERS.items():
+        config = tools.get(tool)
+        provider = config.get("provider") if isinstance(config, dict) else None
+        handler = tool_map.get(provider or defaults[tool])
+        if handler is not None:
+            handlers[tool] = handler
+    return handlers
+
+
+def _cached_tool_entry(db_engine, settings) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    ttl = _tool_providers_ttl_sec()
+    if ttl <= 0:
+        resolved = resolve_tool_providers(db_engine, settings)
+        return resolved, resolve_tool_handlers(resolved, settings)
+
+    # Settings are unhashable pydantic models; the cached entry keeps a
+    # reference to both objects so their ids cannot be reused while cached.
+    key = (id(db_engine), id(settings))
+    now = time.monotonic()
+    cached = _tool_providers_cache.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[2], cached[3]
+
+    with _tool_providers_lock:
+        cached = _tool_providers_cache.get(key)
+        if cached is None or now - cached[0] >= ttl:
+            resolved = resolve_tool_providers(db_engine, settings)
+            handlers = resolve_tool_handlers(resolved, settings)
+            cached = (time.monotonic(), (db_engine, settings), resolved, handlers)
+            _tool_providers_cache[key] = cached
+        return cached[2], cached[3]
+
+
+def get_cached_tool_providers(db_engine=engine, settings=None) -> Dict[str, Any]:
+    """
+    TTL-cached resolve_tool_providers for the pipeline hot path.
+    Avoids a provider_config round-trip per queued task; admin updates call
+    clear_tool_providers_cache() so toggles take effect immediately.
+    Each caller gets its own copy, so mutating it cannot leak into the cache.
+    """
+    resolved, _handlers = _cached_tool_entry(db_engine, settings)
+    return copy.deepcopy(resolved)
+
+
+def get_cached_tool_handlers(db_engine=engine, settings=None) -> Dict[str, Any]:
+    """
+    Step handlers for the configured providers, resolved together with
+    get_cached_tool_providers() and invalidated by the same
+    clear_tool_providers_cache() call.
+    """
+    _resolved, handlers = _cached_tool_entry(db_engine, settings)
+    return dict(handlers)
+
+
+def clear_tool_providers_cache() -> None:
+    with _tool_providers_lock:
+        _tool_providers_cache.clear()
+
+
+# Handlers are plain step coroutines, so the table is built once at import.
+PROVIDER_HANDLERS: Dict[str, Dict[str, Any]] = {
+    "parse": {
+        "xiongmao": run_parse_step,
+        "xiaomao": run_parse_step,
+    },
+    "subtitles": {
+        "gemini": run_subtitles_step,
+        "whisper": run_subtitles_step,
+    },
+    "dub": {
+        "lovo": run_dub_step,
+        "edge-tts": run_dub_step,
+    },
+    "pack": {
+        "capcut": run_pack_step,
+        "youcut": run_pack_step,
+    },
+}
+
+
 def get_provider(tool_type: str, name: str):
-    providers = {
-        "parse": {
-            "xiongmao": run_parse_step,
-            "xiaomao": run_parse_step,
-        },
-        "subtitles": {
-            "gemini": run_subtitles_step,
-            "whisper": run_subtitles_step,
-        },
-        "dub": {
-            "lovo": run_dub_step,
-            "edge-tts": run_dub_step,
-        },
-        "pack": {
-            "capcut": run_pack_step,
-            "youcut": run_pack_step,
-        },
-    }
-    tool_map = providers.get(tool_type, {})
+    tool_map = PROVIDER_HANDLERS.get(tool_type, {})
     if name not in tool_map:
         raise KeyError(f"Unknown provider: {tool_type}:{name}")
     return tool_map[name]
@@ -28,10 +28,21 @@ def get_whisper_model():
         except Exception as exc:  # pragma: no cover
             raise RuntimeError("faster-whisper is not available") from exc
 
-        model_size = os.getenv("WHISPER_MODEL_SIZE", "small")
+        # Distilled checkpoints (e.g. "distil-large-v3") load through the same
+        # API but are English-only; keep the multilingual default for mm/zh.
+        model_size = (
+            os.getenv("WHISPER_MODEL_SIZE")
+            or os.getenv("FASTER_WHISPER_MODEL")
+            or "small"
+        )
         device = os.getenv("WHISPER_DEVICE", "cpu")
         compute_type = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
         download_root = os.getenv("WHISPER_DOWNLOAD_ROOT")
+        # 0 lets CTranslate2 pick; operators can pin it to the container's cores.
+        try:
+            cpu_threads = int(os.getenv("WHISPER_CPU_THREADS", "0"))
+        except ValueError:
+            cpu_threads = 0
 
         logger.info(
             "WHISPER_MODEL_INIT",
@@ -40,6 +51,7 @@ def get_whisper_model():
                 "device": device,
                 "compute_type": compute_type,
                 "download_root": download_root,
+                "cpu_threads": cpu_threads,
             },
         )
 
@@ -48,5 +60,6 @@ def get_whisper_model():
             device=device,
             compute_type=compute_type,
             download_root=download_root,
+            cpu_threads=cpu_threads,
         )
         return _model
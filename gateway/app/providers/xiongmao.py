@@ -14,6 +14,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 from gateway.app.config import get_settings
+from gateway.app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -80,12 +81,15 @@ def _resolve_settings():
     return api_base, api_key, app_id
 
 
-async def parse_with_xiongmao(link: str) -> Dict[str, Any]:
+async def parse_with_xiongmao(
+    link: str, client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """Call Xiongmao API and normalize the response.
 
     Supports Douyin/TikTok/Xiaohongshu links handled by the provider. This
     implementation keeps the baseline request/response behavior while adding
-    gentle validation and logging for easier diagnosis.
+    gentle validation and logging for easier diagnosis. ``client`` defaults to
+    the shared pooled client of the running event loop.
     """
 
     api_base, api_key, app_id = _resolve_settings()
@@ -100,10 +104,10 @@ async def parse_with_xiongmao(link: str) -> Dict[str, Any]:
     params = {"ak": api_key, "link": link}
     logger.debug("Requesting Xiongmao parse", extra={"url": url, "link": link})
 
+    client = client or get_http_client()
     try:
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+        response = await client.get(url, params=params, timeout=20)
+        response.raise_for_status()
     except httpx.HTTPError as exc:  # pragma: no cover - network dependent
         logger.exception("Xiongmao provider HTTP error for link %s", link)
         raise XiongmaoError(f"provider error: {exc}") from exc
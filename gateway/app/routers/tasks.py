@@ -5,8 +5,6 @@ import hashlib
 import logging
 import os
 import re
-import shutil
-import subprocess
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -48,7 +46,9 @@ from ..services.steps_v1 import (
     run_parse_step as run_parse_step_v1,
     run_subtitles_step as run_subtitles_step_v1,
     run_dub_step as run_dub_step_v1,
+    ensure_mp3_audio,
 )
+from ..services.pack_service import PackError
 def coerce_datetime(v: Any) -> Optional[datetime]:
     """
     Best-effort convert repository stored value into a timezone-aware datetime.
@@ -462,6 +462,21 @@ def download_scenes(task_id: str, repo=Depends(get_task_repository)):
     return RedirectResponse(url=get_download_url(str(scenes_key)), status_code=302)
 
 
+@pages_router.get("/v1/tasks/{task_id}/pack/status")
+def task_pack_status(task_id: str, repo=Depends(get_task_repository)):
+    """Poll target for the 202 returned by POST /v1/pack."""
+
+    task = repo.get(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return {
+        "task_id": task_id,
+        "pack_status": _task_value(task, "pack_status"),
+        "pack_error": _task_value(task, "pack_error"),
+        "pack_key": _task_key(task, "pack_key") or _task_key(task, "pack_path"),
+    }
+
+
 @pages_router.get("/v1/tasks/{task_id}/status")
 def task_status(task_id: str, repo=Depends(get_task_repository)):
     task = repo.get(task_id)
@@ -549,30 +564,10 @@ def _text_or_redirect(key: str, inline: bool) -> Response:
 
 
 def _ensure_mp3_audio(src_path: Path, dst_path: Path) -> Path:
-    if src_path.suffix.lower() == ".mp3":
-        return src_path
-
-    ffmpeg = shutil.which("ffmpeg")
-    if not ffmpeg:
-        raise HTTPException(status_code=500, detail="ffmpeg not found for mp3 conversion")
-
-    dst_path.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        ffmpeg,
-        "-y",
-        "-i",
-        str(src_path),
-        "-codec:a",
-        "libmp3lame",
-        str(dst_path),
-    ]
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if p.returncode != 0 or not dst_path.exists() or dst_path.stat().st_size == 0:
-        raise HTTPException(
-            status_code=500,
-            detail=f"ffmpeg mp3 conversion failed: {p.stderr[-800:]}",
-        )
-    return dst_path
+    try:
+        return ensure_mp3_audio(src_path, dst_path)
+    except PackError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 def _resolve_download_urls(task: dict) -> dict[str, Optional[str]]:
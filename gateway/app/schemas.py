@@ -1,6 +1,6 @@
 from datetime import datetime
 import re
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, constr, root_validator, validator
 
@@ -54,6 +54,38 @@ class PackRequest(BaseModel):
     task_id: str
 
 
+class StepResult(BaseModel):
+    """Normalized view of a step handler result used by the pipeline.
+
+    Handlers keep returning their API dicts; the pipeline converts once via
+    :meth:`from_result` instead of branching on dict/attribute access per field.
+    """
+
+    raw_path: Optional[str] = None
+    raw_exists: Optional[bool] = None
+    duration_sec: Optional[float] = None
+    audio_task_path: Optional[str] = None
+    audio_path: Optional[str] = None
+    pack_key: Optional[str] = None
+    extra: dict[str, Any] = {}
+
+    @classmethod
+    def from_result(cls, result: Any) -> "StepResult":
+        if isinstance(result, StepResult):
+            return result
+        data = result if isinstance(result, dict) else dict(getattr(result, "__dict__", {}))
+        pack_key = data.get("pack_key") or data.get("zip_key") or data.get("pack_path")
+        return cls(
+            raw_path=data.get("raw_task_path"),
+            raw_exists=data.get("raw_exists"),
+            duration_sec=data.get("duration_sec") or None,
+            audio_task_path=data.get("mm_audio_task_path"),
+            audio_path=data.get("audio_path") or data.get("path"),
+            pack_key=str(pack_key) if pack_key else None,
+            extra=data,
+        )
+
+
 class PublishRequest(BaseModel):
     task_id: str
     provider: Optional[Literal["r2", "local"]] = None
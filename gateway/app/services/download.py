@@ -7,6 +7,7 @@ from urllib.parse import urlparse
 
 import httpx
 
+from gateway.app.core.http_client import get_http_client
 from gateway.app.core.workspace import raw_path
 
 
@@ -27,10 +28,13 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
-async def download_raw_video(task_id: str, url: str) -> Path:
+async def download_raw_video(
+    task_id: str, url: str, client: httpx.AsyncClient | None = None
+) -> Path:
     if not url:
         raise DownloadError("missing download url")
 
+    client = client or get_http_client()
     destination = raw_path(task_id)
     url_host = urlparse(url).netloc
     retries = _env_int("DOWNLOAD_RETRIES", 2)
@@ -38,6 +42,7 @@ async def download_raw_video(task_id: str, url: str) -> Path:
     read_timeout = _env_int("DOWNLOAD_READ_TIMEOUT_SEC", 60)
     write_timeout = _env_int("DOWNLOAD_WRITE_TIMEOUT_SEC", 60)
     pool_timeout = _env_int("DOWNLOAD_POOL_TIMEOUT_SEC", 10)
+    chunk_size = _env_int("DOWNLOAD_CHUNK_BYTES", 1 << 20)
     timeout = httpx.Timeout(
         connect=connect_timeout,
         read=read_timeout,
@@ -52,15 +57,15 @@ async def download_raw_video(task_id: str, url: str) -> Path:
         status_code = None
         content_length = None
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                async with client.stream("GET", url) as response:
-                    status_code = response.status_code
-                    content_length = response.headers.get("content-length")
-                    response.raise_for_status()
-                    with destination.open("wb") as file_handle:
-                        async for chunk in response.aiter_bytes():
-                            file_handle.write(chunk)
-                            bytes_written += len(chunk)
+            async with client.stream("GET", url, timeout=timeout) as response:
+                status_code = response.status_code
+                content_length = response.headers.get("content-length")
+                response.raise_for_status()
+                with destination.open("wb") as file_handle:
+                    # Disk writes run in a worker thread so the loop keeps receiving.
+                    async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                        await asyncio.to_thread(file_handle.write, chunk)
+                        bytes_written += len(chunk)
             logger.info(
                 "Download attempt succeeded",
                 extra={
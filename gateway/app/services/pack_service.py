@@ -1,14 +1,12 @@
-import json
 import os
-import re
-import shutil
-import subprocess
-import tempfile
+import struct
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
 
 from gateway.app.ports.storage_provider import get_storage_service
+from gateway.app.core.subtitle_utils import srt_to_txt
 from gateway.app.core.workspace import pack_zip_path, relative_to_workspace
+from gateway.app.utils.archive import open_media_zip, zip_write_file
+from gateway.app.utils.json_bytes import dumps_pretty
 from gateway.app.utils.keys import KeyBuilder
 
 README_TEMPLATE = """CapCut pack usage
@@ -25,59 +23,36 @@ class PackError(Exception):
     """Raised when packing fails."""
 
 
-_SRT_TIME_RE = re.compile(
-    r"\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}"
-)
-
-
-def srt_to_txt(srt_text: str) -> str:
-    blocks = [b for b in srt_text.split("\n\n") if b.strip()]
-    lines_out: list[str] = []
-    for block in blocks:
-        text_lines: list[str] = []
-        for line in block.splitlines():
-            s = line.strip()
-            if not s:
-                continue
-            if s.isdigit():
-                continue
-            if "-->" in s or _SRT_TIME_RE.search(s):
-                continue
-            text_lines.append(s)
-        if text_lines:
-            lines_out.append(" ".join(text_lines))
-    return "\n".join(lines_out).strip() + ("\n" if lines_out else "")
-
-
-def _ensure_txt_from_srt(dst_txt: Path, src_srt: Path) -> None:
-    srt_text = src_srt.read_text(encoding="utf-8")
-    dst_txt.write_text(srt_to_txt(srt_text), encoding="utf-8")
-
-
-def _ensure_silence_audio_ffmpeg(out_path: Path, seconds: int = 1) -> None:
-    """Create a silent WAV via ffmpeg."""
-
-    ffmpeg = shutil.which("ffmpeg")
-    if not ffmpeg:
-        raise PackError("ffmpeg not found in PATH (required). Please install ffmpeg.")
-
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        ffmpeg,
-        "-y",
-        "-f",
-        "lavfi",
-        "-i",
-        "anullsrc=r=16000:cl=mono",
-        "-t",
-        str(seconds),
-        "-acodec",
-        "pcm_s16le",
-        str(out_path),
-    ]
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if p.returncode != 0 or not out_path.exists() or out_path.stat().st_size == 0:
-        raise PackError(f"ffmpeg silence generation failed: {p.stderr[-800:]}")
+def write_silence_wav(out_path: Path, seconds: int = 1, rate: int = 16000) -> None:
+    """Write a silent mono 16-bit PCM WAV (what ffmpeg's anullsrc produced).
+
+    The 44-byte RIFF header plus zeroed samples; no ffmpeg process needed.
+    """
+
+    data_len = rate * 2 * seconds
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_len,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        rate,
+        rate * 2,
+        2,
+        16,
+        b"data",
+        data_len,
+    )
+    try:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "wb") as fh:
+            fh.write(header)
+            fh.write(bytes(data_len))
+    except OSError as exc:
+        raise PackError(f"silence audio generation failed: {exc}") from exc
 
 
 def _maybe_fill_missing_for_pack(*, raw_path: Path, audio_path: Path, subs_path: Path) -> None:
@@ -88,7 +63,58 @@ def _maybe_fill_missing_for_pack(*, raw_path: Path, audio_path: Path, subs_path:
         return
 
     if audio_path and not audio_path.exists():
-        _ensure_silence_audio_ffmpeg(audio_path, seconds=1)
+        write_silence_wav(audio_path, seconds=1)
+
+
+def write_capcut_pack_zip(
+    zip_path: Path,
+    task_id: str,
+    *,
+    raw_file: Path,
+    audio_file: Path,
+    audio_filename: str,
+    subs_mm_srt: Path,
+    mm_txt_path: Path | None,
+) -> None:
+    """Zip the CapCut pack straight from its source files.
+
+    Inputs are read once, directly into the archive under their pack names;
+    mm.txt (derived from the SRT when ``mm_txt_path`` is None), manifest.json,
+    README.md and scenes/.keep are generated in memory. Nothing is staged on
+    disk.
+    """
+
+    prefix = f"deliver/packs/{task_id}"
+    manifest = {
+        "version": "1.8",
+        "pack_type": "capcut_v18",
+        "task_id": task_id,
+        "language": "my",
+        "assets": {
+            "raw_video": "raw/raw.mp4",
+            "voice": f"audio/{audio_filename}",
+            "subtitle": "subs/mm.srt",
+            "scenes_dir": "scenes/",
+        },
+    }
+    # Media entries are stored as-is; text entries use fast deflate.
+    with open_media_zip(zip_path) as zf:
+        zip_write_file(zf, raw_file, f"{prefix}/raw/raw.mp4")
+        zip_write_file(zf, audio_file, f"{prefix}/audio/{audio_filename}")
+        zip_write_file(zf, subs_mm_srt, f"{prefix}/subs/mm.srt")
+        if mm_txt_path is not None:
+            zip_write_file(zf, mm_txt_path, f"{prefix}/subs/mm.txt")
+        else:
+            zf.writestr(
+                f"{prefix}/subs/mm.txt",
+                srt_to_txt(subs_mm_srt.read_text(encoding="utf-8")),
+            )
+        zf.writestr(f"{prefix}/scenes/.keep", b"")
+        zf.writestr(f"{prefix}/manifest.json", dumps_pretty(manifest))
+        zf.writestr(
+            f"{prefix}/README.md",
+            README_TEMPLATE.replace("{audio_filename}", audio_filename),
+        )
 
 
 def create_capcut_pack(
@@ -113,59 +139,18 @@ def create_capcut_pack(
     resolved_pack_path = pack_path or pack_zip_path(task_id)
     resolved_pack_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir) / f"pack_{task_id}"
-        tmp_path.mkdir(parents=True, exist_ok=True)
-
-        raw_dir = tmp_path / "raw"
-        audio_dir = tmp_path / "audio"
-        subs_dir = tmp_path / "subs"
-        scenes_dir = tmp_path / "scenes"
-        for d in (raw_dir, audio_dir, subs_dir, scenes_dir):
-            d.mkdir(parents=True, exist_ok=True)
-
-        audio_ext = audio_path.suffix if audio_path.suffix else ".wav"
-        audio_filename = f"voice_my{audio_ext}"
-
-        shutil.copy(raw_path, raw_dir / "raw.mp4")
-        shutil.copy(audio_path, audio_dir / audio_filename)
-        shutil.copy(subs_path, subs_dir / "mm.srt")
-
-        mm_txt_path = txt_path or subs_path.with_suffix(".txt")
-        if mm_txt_path.exists():
-            shutil.copy(mm_txt_path, subs_dir / "mm.txt")
-        else:
-            _ensure_txt_from_srt(subs_dir / "mm.txt", subs_path)
-
-        (scenes_dir / ".keep").write_text("", encoding="utf-8")
-
-        manifest = {
-            "version": "1.8",
-            "pack_type": "capcut_v18",
-            "task_id": task_id,
-            "language": "my",
-            "assets": {
-                "raw_video": "raw/raw.mp4",
-                "voice": f"audio/{audio_filename}",
-                "subtitle": "subs/mm.srt",
-                "scenes_dir": "scenes/",
-            },
-        }
-        (tmp_path / "manifest.json").write_text(
-            json.dumps(manifest, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        (tmp_path / "README.md").write_text(
-            README_TEMPLATE.format(audio_filename=audio_filename),
-            encoding="utf-8",
-        )
-
-        pack_prefix = Path("deliver") / "packs" / task_id
-        with ZipFile(resolved_pack_path, "w", compression=ZIP_DEFLATED) as zf:
-            for item in tmp_path.rglob("*"):
-                if item.is_file():
-                    arcname = (pack_prefix / item.relative_to(tmp_path)).as_posix()
-                    zf.write(item, arcname=arcname)
+    audio_ext = audio_path.suffix if audio_path.suffix else ".wav"
+    audio_filename = f"voice_my{audio_ext}"
+    mm_txt_path = txt_path or subs_path.with_suffix(".txt")
+    write_capcut_pack_zip(
+        resolved_pack_path,
+        task_id,
+        raw_file=raw_path,
+        audio_file=audio_path,
+        audio_filename=audio_filename,
+        subs_mm_srt=subs_path,
+        mm_txt_path=mm_txt_path if mm_txt_path.exists() else None,
+    )
 
     if not resolved_pack_path.exists():
         raise PackError(f"pack zip not found: {resolved_pack_path}")
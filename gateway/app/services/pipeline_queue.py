@@ -0,0 +1,127 @@
+"""Optional ARQ queue for running the V1 pipeline outside the API process.
+
+When ``PIPELINE_QUEUE_REDIS_URL`` is set and ``arq`` is installed, new tasks are
+enqueued to Redis and executed by a dedicated worker::
+
+    arq gateway.app.services.pipeline_queue.WorkerSettings
+
+Without it the API falls back to FastAPI ``BackgroundTasks``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Any, Optional
+
+from gateway.app.config import create_storage_service, get_settings
+from gateway.app.core.http_client import close_http_client
+from gateway.app.db import Base, engine, ensure_provider_config_table, ensure_task_extra_columns
+from gateway.app.ports.storage_provider import set_storage_service
+from gateway.app.providers.registry import get_cached_tool_handlers
+from gateway.app.steps.pipeline_v1 import run_pipeline_with_session
+
+# 允许未安装 arq 时继续使用 BackgroundTasks
+try:
+    from arq import create_pool
+    from arq.connections import RedisSettings
+except ImportError:
+    create_pool = None
+    RedisSettings = None
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_JOB_NAME = "run_pipeline_job"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _redis_url() -> str:
+    return (os.getenv("PIPELINE_QUEUE_REDIS_URL") or "").strip()
+
+
+def _redis_settings():
+    return RedisSettings.from_dsn(_redis_url())
+
+
+async def create_pipeline_queue() -> Optional[Any]:
+    """Return an ARQ pool when the queue is configured, otherwise ``None``."""
+
+    if not _redis_url():
+        return None
+    if create_pool is None:
+        logger.warning("PIPELINE_QUEUE_REDIS_URL is set but arq is not installed")
+        return None
+    try:
+        return await create_pool(_redis_settings())
+    except Exception:
+        logger.exception("Failed to connect pipeline queue, falling back to BackgroundTasks")
+        return None
+
+
+async def close_pipeline_queue(queue: Optional[Any]) -> None:
+    if queue is None:
+        return
+    try:
+        await queue.close()
+    except Exception:  # pragma: no cover - best effort on shutdown
+        logger.warning("Failed to close pipeline queue", exc_info=True)
+
+
+async def enqueue_pipeline(queue: Optional[Any], task_id: str) -> bool:
+    """Enqueue the pipeline for ``task_id``; return False if the caller must run it.
+
+    A job already queued under the same id counts as enqueued.
+    """
+
+    if queue is None:
+        return False
+    try:
+        job = await queue.enqueue_job(PIPELINE_JOB_NAME, task_id, _job_id=f"pipeline:{task_id}")
+    except Exception:
+        logger.exception("Failed to enqueue pipeline for task %s", task_id)
+        return False
+    if job is None:
+        # ARQ 对重复的 _job_id 返回 None：同一任务已在队列中，不能再本地执行一次
+        logger.info(
+            "PIPELINE_ALREADY_QUEUED",
+            extra={"task_id": task_id, "job_id": f"pipeline:{task_id}"},
+        )
+        return True
+    logger.info(
+        "PIPELINE_ENQUEUED",
+        extra={"task_id": task_id, "job_id": getattr(job, "job_id", None)},
+    )
+    return True
+
+
+async def run_pipeline_job(ctx: dict, task_id: str) -> None:
+    await run_pipeline_with_session(task_id)
+
+
+async def _worker_startup(ctx: dict) -> None:
+    Base.metadata.create_all(bind=engine)
+    ensure_task_extra_columns(engine)
+    ensure_provider_config_table(engine)
+    set_storage_service(create_storage_service())
+    # Resolve provider handlers once so jobs start from a warm cache.
+    get_cached_tool_handlers(engine, get_settings())
+
+
+async def _worker_shutdown(ctx: dict) -> None:
+    # Jobs share the worker loop's pooled HTTP client; close it with the loop.
+    await close_http_client()
+
+
+class WorkerSettings:
+    functions = [run_pipeline_job]
+    on_startup = _worker_startup
+    on_shutdown = _worker_shutdown
+    max_jobs = _env_int("PIPELINE_QUEUE_MAX_JOBS", 10)
+    job_timeout = _env_int("PIPELINE_QUEUE_JOB_TIMEOUT_SEC", 3600)
+    redis_settings = _redis_settings() if RedisSettings is not None and _redis_url() else None
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
-import json
+import io
 import logging
+import os
+import queue
 import re
-import shutil
 import subprocess
+import threading
 import time
+import wave
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Callable, Iterable, Iterator
+from zipfile import ZipFile
 
 from fastapi import HTTPException
 
 from gateway.app.core.workspace import raw_path, workspace_root
 from gateway.app.ports.storage_provider import get_storage_service
+from gateway.app.utils.archive import open_media_zip, zip_tree, zip_write_file
+from gateway.app.utils.binaries import find_binary
+from gateway.app.utils.json_bytes import dumps_pretty
 from gateway.app.utils.timing import log_step_timing
 
 logger = logging.getLogger(__name__)
@@ -25,8 +34,10 @@ DEFAULT_MAX_SCENE_SEC = 15.0
 DEFAULT_MIN_LINES = 3
 DEFAULT_MAX_LINES = 5
 
-SRT_TIME_RE = re.compile(
-    r"(?P<start>\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(?P<end>\d{2}:\d{2}:\d{2}[,\.]\d{3})"
+# A cue's time line; the cue text runs from the next line up to a blank line.
+SRT_CUE_TIME_RE = re.compile(
+    r"[ \t]*(\d{2}):(\d{2}):(\d{2})[,\.](\d{3})[ \t]*-->[ \t]*"
+    r"(\d{2}):(\d{2}):(\d{2})[,\.](\d{3})"
 )
 SRT_LINE_TIME_RE = re.compile(
     r"^\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}"
@@ -38,6 +49,16 @@ class SrtEntry:
     start: float
     end: float
     text: str
+    # Integer-millisecond copies used for clipping/formatting; derived from
+    # start/end when not given.
+    start_ms: int | None = None
+    end_ms: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.start_ms is None:
+            self.start_ms = int(round(self.start * 1000))
+        if self.end_ms is None:
+            self.end_ms = int(round(self.end * 1000))
 
 
 @dataclass
@@ -46,22 +67,107 @@ class SceneRange:
     end: float
 
 
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
 def _ffmpeg_path() -> str:
-    ffmpeg = shutil.which("ffmpeg")  # type: ignore[name-defined]
+    ffmpeg = find_binary("ffmpeg")
     if not ffmpeg:
         raise RuntimeError("ffmpeg not found in PATH")
     return ffmpeg
 
 
 def _run_ffmpeg(args: list[str]) -> None:
-    p = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    # stdout is never read and ffmpeg must not wait on a tty; only stderr is kept.
+    p = subprocess.run(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
     if p.returncode != 0:
         raise RuntimeError(f"ffmpeg failed: {p.stderr[-800:]}")
 
 
+def _ffprobe_path() -> str | None:
+    return find_binary("ffprobe")
+
+
+@lru_cache(maxsize=64)
+def _probe_audio_stream(src: str, _mtime_ns: int, _size: int) -> dict | None:
+    """First audio stream's codec/rate/channels; ``{}`` if none, None if unknown."""
+
+    ffprobe = _ffprobe_path()
+    if not ffprobe:
+        return None
+    p = subprocess.run(
+        [
+            ffprobe,
+            "-v",
+            "error",
+            "-select_streams",
+            "a:0",
+            "-show_entries",
+            "stream=codec_name,sample_rate,channels",
+            "-of",
+            "default=noprint_wrappers=1",
+            src,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if p.returncode != 0:
+        return None
+    info = {}
+    for line in p.stdout.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            info[key.strip()] = value.strip()
+    return info
+
+
+def _source_audio_info(src: Path) -> dict | None:
+    try:
+        st = src.stat()
+    except OSError:
+        return None
+    return _probe_audio_stream(str(src), st.st_mtime_ns, st.st_size)
+
+
+def _source_has_audio(src: Path) -> bool | None:
+    """Whether ``src`` has an audio stream; None when it cannot be probed.
+
+    Cached per file version so a scenes build probes the raw video once
+    instead of discovering a silent source through failed ffmpeg runs.
+    """
+
+    info = _source_audio_info(src)
+    if info is None:
+        return None
+    return bool(info)
+
+
+def _source_audio_is_target_pcm(src: Path) -> bool:
+    # scene audio.wav is pcm_s16le 16 kHz mono; such sources can be copied.
+    info = _source_audio_info(src) or {}
+    return (
+        info.get("codec_name") == "pcm_s16le"
+        and info.get("sample_rate") == "16000"
+        and info.get("channels") == "1"
+    )
+
+
 def _slice_video(src: Path, dst: Path, start: float, end: float) -> None:
     ffmpeg = _ffmpeg_path()
-    dst.parent.mkdir(parents=True, exist_ok=True)
     cmd = [
         ffmpeg,
         "-y",
@@ -78,6 +184,8 @@ def _slice_video(src: Path, dst: Path, start: float, end: float) -> None:
         "-dn",
         "-c:v",
         "copy",
+        "-avoid_negative_ts",
+        "make_zero",
         str(dst),
     ]
     _run_ffmpeg(cmd)
@@ -86,28 +194,25 @@ def _slice_video(src: Path, dst: Path, start: float, end: float) -> None:
 
 
 def _slice_audio(src: Path, dst: Path, start: float, end: float) -> None:
+    if _source_has_audio(src) is False:
+        # Audioless raw: no ffmpeg process at all for this scene's audio.
+        _generate_silence_audio(dst, max(end - start, 0.1))
+        return
     ffmpeg = _ffmpeg_path()
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        ffmpeg,
-        "-y",
-        "-ss",
-        f"{start:.3f}",
-        "-to",
-        f"{end:.3f}",
-        "-i",
-        str(src),
-        "-vn",
-        "-acodec",
-        "pcm_s16le",
-        "-ar",
-        "16000",
-        "-ac",
-        "1",
-        str(dst),
-    ]
+    head = [ffmpeg, "-y", "-ss", f"{start:.3f}", "-to", f"{end:.3f}", "-i", str(src), "-vn"]
+    pcm_cmd = head + ["-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1", str(dst)]
     try:
-        _run_ffmpeg(cmd)
+        if _source_audio_is_target_pcm(src):
+            # Already the delivered format: cut without a decode/encode pass.
+            try:
+                _run_ffmpeg(head + ["-c:a", "copy", str(dst)])
+            except RuntimeError:
+                _run_ffmpeg(pcm_cmd)
+            else:
+                if not dst.exists() or dst.stat().st_size == 0:
+                    _run_ffmpeg(pcm_cmd)
+        else:
+            _run_ffmpeg(pcm_cmd)
     except RuntimeError:
         duration = max(end - start, 0.1)
         _generate_silence_audio(dst, duration)
@@ -115,23 +220,133 @@ def _slice_audio(src: Path, dst: Path, start: float, end: float) -> None:
         raise RuntimeError(f"audio slice missing: {dst}")
 
 
+def _prefetch_source(src: Path) -> None:
+    """Ask the kernel to start reading ``src`` into the page cache.
+
+    The slicing fan-out has many ffmpeg processes seeking into the same raw
+    file at once; warming the cache up front turns their random reads into
+    cache hits. Best effort and non-blocking (readahead runs in the kernel).
+    """
+
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(src, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _slice_scenes_batched(src: Path, jobs: list[tuple[Path, Path, float, float]]) -> bool:
+    """Cut video+audio for many scenes with one ffmpeg process per batch.
+
+    Each scene gets its own fast-seeked input (``-ss/-to`` before ``-i``, same
+    as ``_slice_video``) feeding both its muted video copy and its wav, so a
+    batch replaces 2 process starts and 2 demuxes per scene. Returns False if
+    any batch fails or leaves an output missing; callers then fall back to
+    the per-scene slicers, which also handle sources without audio.
+    """
+
+    if not jobs:
+        return True
+    try:
+        ffmpeg = _ffmpeg_path()
+    except RuntimeError:
+        return False
+    if _source_has_audio(src) is False:
+        # Mapping a:0 would fail every batch; let the per-scene path write silence.
+        return False
+    batch_size = max(1, _env_int("SCENES_FFMPEG_BATCH", 16))
+    for offset in range(0, len(jobs), batch_size):
+        batch = jobs[offset : offset + batch_size]
+        cmd = [ffmpeg, "-y"]
+        for _video_dst, _audio_dst, start, end in batch:
+            cmd += ["-ss", f"{start:.3f}", "-to", f"{end:.3f}", "-i", str(src)]
+        for input_idx, (video_dst, audio_dst, _start, _end) in enumerate(batch):
+            cmd += [
+                "-map",
+                f"{input_idx}:v:0",
+                "-an",
+                "-sn",
+                "-dn",
+                "-c:v",
+                "copy",
+                "-avoid_negative_ts",
+                "make_zero",
+                str(video_dst),
+                "-map",
+                f"{input_idx}:a:0",
+                "-vn",
+                "-acodec",
+                "pcm_s16le",
+                "-ar",
+                "16000",
+                "-ac",
+                "1",
+                str(audio_dst),
+            ]
+        try:
+            _run_ffmpeg(cmd)
+        except RuntimeError:
+            logger.warning("Batched scene slicing failed, falling back to per-scene ffmpeg")
+            return False
+        for video_dst, audio_dst, _start, _end in batch:
+            for dst in (video_dst, audio_dst):
+                if not dst.exists() or dst.stat().st_size == 0:
+                    return False
+    return True
+
+
+def _slice_scenes_parallel(
+    src: Path,
+    jobs: list[tuple[Path, Path, float, float]],
+    on_output: Callable[[Path], None] | None = None,
+) -> None:
+    """Per-scene fallback: run ``_slice_video``/``_slice_audio`` on a thread pool.
+
+    Each call blocks in its own ffmpeg subprocess, so threads scale with cores.
+    ``on_output`` is called with each output path as soon as it is written.
+    """
+
+    if not jobs:
+        return
+    workers = _env_int(
+        "SCENES_FFMPEG_CONCURRENCY",
+        _env_int("SCENES_SLICE_WORKERS", os.cpu_count() or 2),
+    )
+    workers = min(workers, len(jobs) * 2)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {}
+        for video_dst, audio_dst, start, end in jobs:
+            futures[executor.submit(_slice_video, src, video_dst, start, end)] = video_dst
+            futures[executor.submit(_slice_audio, src, audio_dst, start, end)] = audio_dst
+        for future in as_completed(futures):
+            future.result()
+            if on_output is not None:
+                on_output(futures[future])
+
+
+SILENCE_SAMPLE_RATE = 16000
+
+
 def _generate_silence_audio(dst: Path, seconds: float) -> None:
-    ffmpeg = _ffmpeg_path()
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        ffmpeg,
-        "-y",
-        "-f",
-        "lavfi",
-        "-i",
-        "anullsrc=r=16000:cl=mono",
-        "-t",
-        f"{seconds:.3f}",
-        "-acodec",
-        "pcm_s16le",
-        str(dst),
-    ]
-    _run_ffmpeg(cmd)
+    """Write ``seconds`` of 16 kHz mono pcm_s16le silence without ffmpeg."""
+
+    frames = int(round(seconds * SILENCE_SAMPLE_RATE))
+    chunk = bytes(2 * SILENCE_SAMPLE_RATE)
+    with wave.open(str(dst), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SILENCE_SAMPLE_RATE)
+        while frames > 0:
+            step = min(frames, SILENCE_SAMPLE_RATE)
+            wf.writeframesraw(chunk[: 2 * step])
+            frames -= step
 
 
 def _derive_scenes_from_srt(
@@ -145,55 +360,88 @@ def _derive_scenes_from_srt(
     if not entries:
         raise RuntimeError("no srt entries to derive scenes")
 
-    scenes: list[SceneRange] = []
-    scene_start = entries[0].start
-    count = 0
+    # One pass over integer-millisecond cue bounds; thresholds converted once.
+    starts_ms = [entry.start_ms for entry in entries]
+    ends_ms = [entry.end_ms for entry in entries]
+    min_scene_ms = int(round(min_scene_sec * 1000))
+    max_scene_ms = int(round(max_scene_sec * 1000))
+    last = len(entries) - 1
 
-    for idx, entry in enumerate(entries):
+    cuts: list[tuple[int, int]] = []
+    scene_start = starts_ms[0]
+    count = 0
+    for idx in range(last + 1):
         count += 1
-        scene_end = entry.end
+        scene_end = ends_ms[idx]
         duration = scene_end - scene_start
-        next_end = entries[idx + 1].end if idx + 1 < len(entries) else None
-
-        cut = False
-        if duration >= max_scene_sec:
-            cut = True
-        elif count >= max_lines:
-            cut = True
-        elif count >= min_lines and duration >= min_scene_sec:
-            if next_end is None or (next_end - scene_start) > max_scene_sec:
-                cut = True
-
-        if cut:
-            scenes.append(SceneRange(start=scene_start, end=scene_end))
-            if idx + 1 < len(entries):
-                scene_start = entries[idx + 1].start
+        if (
+            duration >= max_scene_ms
+            or count >= max_lines
+            or (
+                count >= min_lines
+                and duration >= min_scene_ms
+                and (idx == last or ends_ms[idx + 1] - scene_start > max_scene_ms)
+            )
+        ):
+            cuts.append((scene_start, scene_end))
+            if idx < last:
+                scene_start = starts_ms[idx + 1]
             count = 0
 
-    if count > 0 and scenes:
-        last_end = entries[-1].end
-        scenes.append(SceneRange(start=scene_start, end=last_end))
-    if not scenes:
-        scenes.append(SceneRange(start=entries[0].start, end=entries[-1].end))
-    return scenes
+    if count > 0 and cuts:
+        cuts.append((scene_start, ends_ms[last]))
+    if not cuts:
+        cuts.append((starts_ms[0], ends_ms[last]))
+    return [SceneRange(start=start / 1000.0, end=end / 1000.0) for start, end in cuts]
+
+
+def _iter_srt_entries(lines: Iterable[str]) -> Iterator[SrtEntry]:
+    """Yield cues from SRT lines as each cue's closing blank line is read.
+
+    Index lines and anything outside a cue are skipped; a cue starts at its
+    time line and keeps its non-blank text lines.
+    """
+
+    cue: tuple[int, int] | None = None
+    text_lines: list[str] = []
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        if cue is None:
+            match = SRT_CUE_TIME_RE.match(line)
+            if match is not None:
+                sh, sm, ss, sms, eh, em, es, ems = match.groups()
+                cue = (
+                    ((int(sh) * 60 + int(sm)) * 60 + int(ss)) * 1000 + int(sms),
+                    ((int(eh) * 60 + int(em)) * 60 + int(es)) * 1000 + int(ems),
+                )
+            continue
+        if not line.strip(" \t"):
+            yield _srt_entry(cue, text_lines)
+            cue = None
+            text_lines = []
+        elif line.strip():
+            text_lines.append(line)
+    if cue is not None:
+        yield _srt_entry(cue, text_lines)
+
+
+def _srt_entry(cue: tuple[int, int], text_lines: list[str]) -> SrtEntry:
+    start_ms, end_ms = cue
+    return SrtEntry(
+        start=start_ms / 1000.0,
+        end=end_ms / 1000.0,
+        text="\n".join(text_lines),
+        start_ms=start_ms,
+        end_ms=end_ms,
+    )
 
 
-def _parse_srt(text: str) -> list[SrtEntry]:
-    blocks = [b for b in text.strip().split("\n\n") if b.strip()]
-    entries: list[SrtEntry] = []
-    for block in blocks:
-        lines = [l for l in block.splitlines() if l.strip()]
-        if len(lines) < 2:
-            continue
-        time_line = lines[1] if lines[0].strip().isdigit() else lines[0]
-        match = SRT_TIME_RE.search(time_line)
-        if not match:
-            continue
-        start = _parse_srt_time(match.group("start"))
-        end = _parse_srt_time(match.group("end"))
-        text_lines = lines[2:] if lines[0].strip().isdigit() else lines[1:]
-        entries.append(SrtEntry(start=start, end=end, text="\n".join(text_lines)))
-    return entries
+def _parse_srt(source: str | Iterable[str]) -> list[SrtEntry]:
+    """Parse SRT text, or lines from an open file, into cues."""
+
+    if isinstance(source, str):
+        source = io.StringIO(source, newline="")
+    return list(_iter_srt_entries(source))
 
 
 def _srt_to_plain_text(srt_text: str) -> str:
@@ -204,57 +452,106 @@ def _srt_to_plain_text(srt_text: str) -> str:
             continue
         if line.isdigit():
             continue
-        if SRT_LINE_TIME_RE.match(line):
+        # Only lines containing the arrow can be time lines; skip the regex
+        # for ordinary cue text.
+        if "-->" in line and SRT_LINE_TIME_RE.match(line):
             continue
         lines.append(line)
     return "\n".join(lines).strip() + ("\n" if lines else "")
 
 
-def _write_scene_subtitles(scene_dir: Path, srt_content: str) -> None:
-    scene_dir.mkdir(parents=True, exist_ok=True)
+def _write_scene_subtitles(
+    scene_dir: Path,
+    srt_content: str,
+    plain_text: str | None = None,
+) -> None:
     (scene_dir / "subs.srt").write_text(srt_content, encoding="utf-8")
-    (scene_dir / "subs.txt").write_text(
-        _srt_to_plain_text(srt_content),
-        encoding="utf-8",
-    )
+    if plain_text is None:
+        plain_text = _srt_to_plain_text(srt_content)
+    (scene_dir / "subs.txt").write_text(plain_text, encoding="utf-8")
 
 
-def _parse_srt_time(value: str) -> float:
-    h, m, rest = value.replace(",", ".").split(":")
-    s, ms = rest.split(".")
-    return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
+def _format_srt_ms(ms_total: int) -> str:
+    h, rest = divmod(ms_total, 3_600_000)
+    m, rest = divmod(rest, 60_000)
+    s, ms = divmod(rest, 1000)
+    return f"{h:02}:{m:02}:{s:02},{ms:03}"
 
 
-def _format_srt_time(seconds: float) -> str:
-    seconds = max(seconds, 0.0)
-    ms_total = int(round(seconds * 1000))
-    ms = ms_total % 1000
-    s_total = ms_total // 1000
-    s = s_total % 60
-    m_total = s_total // 60
-    m = m_total % 60
-    h = m_total // 60
-    return f"{h:02}:{m:02}:{s:02},{ms:03}"
+def _srt_max_ends(entries: list[SrtEntry]) -> list[float] | None:
+    """Running max of entry ends, for bisecting to a scene's first entry.
 
+    Returns None when entries are not ordered by start, since the early
+    exit in ``_overlapping_entries`` relies on that order.
+    """
 
-def _clip_srt(entries: Iterable[SrtEntry], start: float, end: float) -> str:
-    out_lines: list[str] = []
+    max_ends: list[float] = []
+    running = float("-inf")
+    prev_start = float("-inf")
+    for entry in entries:
+        if entry.start < prev_start:
+            return None
+        prev_start = entry.start
+        running = max(running, entry.end)
+        max_ends.append(running)
+    return max_ends
+
+
+def _overlapping_entries(
+    entries: list[SrtEntry],
+    start: float,
+    end: float,
+    max_ends: list[float] | None = None,
+) -> Iterator[SrtEntry]:
+    lo = bisect_right(max_ends, start) if max_ends is not None else 0
+    for i in range(lo, len(entries)):
+        entry = entries[i]
+        if max_ends is not None and entry.start >= end:
+            break
+        if entry.end <= start or entry.start >= end:
+            continue
+        yield entry
+
+
+def _clip_srt_with_text(
+    entries: Iterable[SrtEntry],
+    start: float,
+    end: float,
+    max_ends: list[float] | None = None,
+) -> tuple[str, str]:
+    """Return the clipped SRT and its subs.txt text from one pass over cues.
+
+    The plain text is built from the cue texts alone, so the index and time
+    lines never need to be re-scanned.
+    """
+
+    cues: list[str] = []
+    texts: list[str] = []
     idx = 1
+    if max_ends is not None:
+        entries = _overlapping_entries(list(entries), start, end, max_ends)
+    # Compare and offset in integer milliseconds; no float rounding per cue.
+    scene_start_ms = int(round(start * 1000))
+    scene_end_ms = int(round(end * 1000))
     for entry in entries:
-        e_start = float(entry.start)
-        e_end = float(entry.end)
-        if e_end <= start or e_start >= end:
+        e_start_ms = entry.start_ms
+        e_end_ms = entry.end_ms
+        if e_end_ms <= scene_start_ms or e_start_ms >= scene_end_ms:
             continue
-        new_start = max(e_start, start) - start
-        new_end = min(e_end, end) - start
-        if new_end <= 0:
+        end_ms = min(e_end_ms, scene_end_ms) - scene_start_ms
+        if end_ms <= 0:
             continue
-        out_lines.append(str(idx))
-        out_lines.append(f"{_format_srt_time(new_start)} --> {_format_srt_time(new_end)}")
-        out_lines.append(entry.text.strip())
-        out_lines.append("")
+        start_ms = max(e_start_ms, scene_start_ms) - scene_start_ms
+        text = entry.text.strip()
+        cues.append(
+            f"{idx}\n{_format_srt_ms(start_ms)} --> {_format_srt_ms(end_ms)}\n"
+            f"{text}\n\n"
+        )
+        texts.append(text)
         idx += 1
-    return "\n".join(out_lines).strip() + ("\n" if idx > 1 else "")
+    if not cues:
+        return "", ""
+    return "".join(cues).rstrip("\n") + "\n", _srt_to_plain_text("\n".join(texts))
 
 
 def _find_source_srt(task_id: str) -> tuple[Path, str]:
@@ -359,7 +656,131 @@ Q3：Scenes.zip 会影响 Pack.zip 吗？/ Scenes.zip က Pack.zip ကိုသ
 
 
 def _write_readme(dst: Path, task_id: str) -> None:
-    dst.write_text(README_TEMPLATE.format(task_id=task_id), encoding="utf-8")
+    dst.write_text(README_TEMPLATE.replace("{task_id}", task_id), encoding="utf-8")
+
+
+def _slice_all_scenes(
+    src: Path,
+    jobs: list[tuple[Path, Path, float, float]],
+    on_output: Callable[[Path], None] | None = None,
+) -> None:
+    if _slice_scenes_batched(src, jobs):
+        # Single-pass slicers only finish as a whole; report all outputs.
+        if on_output is not None:
+            for video_dst, audio_dst, _start, _end in jobs:
+                on_output(video_dst)
+                on_output(audio_dst)
+        return
+    _slice_scenes_parallel(src, jobs, on_output)
+
+
+class _SceneZipPipeline:
+    """Zip finished scene dirs on a background thread while slicing runs.
+
+    A scene dir is queued once its metadata and both media files are
+    written, so zip I/O overlaps the remaining ffmpeg work. Only the
+    pipeline thread writes to ``zf`` until :meth:`close` returns.
+    """
+
+    # scene.json/subs, video.mp4, audio.wav
+    PARTS_PER_SCENE = 3
+
+    def __init__(self, zf: ZipFile, arc_prefix: str) -> None:
+        self._zf = zf
+        self._arc_prefix = arc_prefix
+        self._queue: queue.Queue[Path | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._parts: dict[Path, int] = {}
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="scenes-zip", daemon=True)
+        self._thread.start()
+
+    def part_done(self, scene_dir: Path) -> None:
+        with self._lock:
+            count = self._parts.get(scene_dir, 0) + 1
+            self._parts[scene_dir] = count
+        if count == self.PARTS_PER_SCENE:
+            self._queue.put(scene_dir)
+
+    def output_done(self, output_path: Path) -> None:
+        self.part_done(output_path.parent)
+
+    def _run(self) -> None:
+        while True:
+            scene_dir = self._queue.get()
+            if scene_dir is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                zip_tree(self._zf, scene_dir, f"{self._arc_prefix}/{scene_dir.name}")
+            except BaseException as exc:  # re-raised from close()
+                self._error = exc
+
+    def close(self, *, raise_error: bool = True) -> None:
+        """Wait for queued scenes to be zipped; re-raise a zip failure."""
+
+        self._queue.put(None)
+        self._thread.join()
+        if raise_error and self._error is not None:
+            raise self._error
+
+
+def _write_scene_metadata(
+    scene_dir: Path,
+    scene: SceneRange,
+    *,
+    task_id: str,
+    raw: Path,
+    source_lang: str,
+    srt_entries: list[SrtEntry],
+    srt_max_ends: list[float] | None,
+) -> dict:
+    """Write one scene's subs and scene.json; return its manifest entry."""
+
+    scene_id = scene_dir.name
+    start_r = round(scene.start, 3)
+    end_r = round(scene.end, 3)
+
+    # One index lookup per scene feeds both the clipped subs and the preview.
+    overlapping = list(
+        _overlapping_entries(srt_entries, scene.start, scene.end, srt_max_ends)
+    )
+    clipped_srt, plain_text = _clip_srt_with_text(overlapping, scene.start, scene.end)
+    _write_scene_subtitles(scene_dir, clipped_srt, plain_text)
+
+    preview = ""
+    if overlapping:
+        preview = overlapping[0].text.splitlines()[0].strip()
+
+    scene_payload = {
+        "scene_id": scene_id,
+        "source": {
+            "task_id": task_id,
+            "origin_video": str(raw),
+            "time_range": [start_r, end_r],
+        },
+        "semantics": {
+            "role": "unknown",
+            "language": source_lang,
+            "summary": preview or "",
+        },
+        "assets": {
+            "video": "video.mp4",
+            "audio": "audio.wav",
+            "subs": "subs.srt",
+        },
+    }
+    (scene_dir / "scene.json").write_bytes(dumps_pretty(scene_payload))
+
+    return {
+        "scene_id": scene_id,
+        "start": start_r,
+        "end": end_r,
+        "duration": round(scene.end - scene.start, 3),
+        "role": "unknown",
+        "dir": f"scenes/{scene_id}",
+    }
 
 
 def generate_scenes_package(
@@ -375,7 +796,8 @@ def generate_scenes_package(
         raise RuntimeError("raw video not found")
 
     source_srt, source_lang = _find_source_srt(task_id)
-    srt_entries = _parse_srt(source_srt.read_text(encoding="utf-8"))
+    with source_srt.open("r", encoding="utf-8", newline="") as srt_file:
+        srt_entries = _parse_srt(srt_file)
     scenes = _derive_scenes_from_srt(
         srt_entries,
         min_scene_sec=min_scene_sec,
@@ -384,78 +806,109 @@ def generate_scenes_package(
         max_lines=max_lines,
     )
 
+    srt_max_ends = _srt_max_ends(srt_entries)
+
     out_root = workspace_root() / "deliver" / "scenes" / task_id
     package_root = out_root / "scenes_package"
     scenes_root = package_root / "scenes"
-    package_root.mkdir(parents=True, exist_ok=True)
     scenes_root.mkdir(parents=True, exist_ok=True)
 
-    manifest_scenes: list[dict] = []
+    # Filled by scene index, so entries keep scene order however they are built.
+    manifest_scenes: list[dict | None] = [None] * len(scenes)
+
+    # The scene dirs are created once here; the slicers and metadata writers
+    # below assume they exist.
+    scene_dirs = [scenes_root / f"scene_{idx:03d}" for idx in range(1, len(scenes) + 1)]
+    for scene_dir in scene_dirs:
+        scene_dir.mkdir(exist_ok=True)
+    slice_jobs = [
+        (scene_dir / "video.mp4", scene_dir / "audio.wav", scene.start, scene.end)
+        for scene_dir, scene in zip(scene_dirs, scenes)
+    ]
+    _prefetch_source(raw)
+    zip_path = out_root / "scenes.zip"
+    arc_root = f"deliver/scenes/{task_id}"
+    with open_media_zip(zip_path) as zf:
+        # ffmpeg slicing runs in the background while the per-scene subtitles
+        # and scene.json are written; both only touch their own files per
+        # scene dir. Finished scene dirs are zipped as they complete.
+        pipeline = _SceneZipPipeline(zf, f"{arc_root}/scenes")
+        try:
+            with ThreadPoolExecutor(max_workers=1) as slicer:
+                slicing = slicer.submit(
+                    _slice_all_scenes,
+                    raw,
+                    slice_jobs,
+                    pipeline.output_done,
+                )
+                for idx, (scene_dir, scene) in enumerate(zip(scene_dirs, scenes)):
+                    manifest_scenes[idx] = _write_scene_metadata(
+                        scene_dir,
+                        scene,
+                        task_id=task_id,
+                        raw=raw,
+                        source_lang=source_lang,
+                        srt_entries=srt_entries,
+                        srt_max_ends=srt_max_ends,
+                    )
+                    pipeline.part_done(scene_dir)
+                slicing.result()
+        except BaseException:
+            pipeline.close(raise_error=False)
+            raise
+        zip_start = time.perf_counter()
+        pipeline.close()
+        _write_package_index(
+            zf,
+            package_root,
+            arc_root,
+            task_id=task_id,
+            raw=raw,
+            source_srt=source_srt,
+            source_lang=source_lang,
+            manifest_scenes=manifest_scenes,
+        )
+    log_step_timing(logger, task_id=task_id, step="scenes_zip", start_time=zip_start)
 
-    for idx, scene in enumerate(scenes, start=1):
-        scene_id = f"scene_{idx:03d}"
-        scene_dir = scenes_root / scene_id
-        scene_dir.mkdir(parents=True, exist_ok=True)
+    storage = get_storage_service()
+    scenes_key = f"deliver/scenes/{task_id}/scenes.zip"
+    storage.upload_file(str(zip_path), scenes_key, content_type="application/zip")
 
-        video_path = scene_dir / "video.mp4"
-        audio_path = scene_dir / "audio.wav"
-        scene_json_path = scene_dir / "scene.json"
+    return {
+        "task_id": task_id,
+        "scenes_key": scenes_key,
+        "scenes_count": len(manifest_scenes),
+        "zip_path": str(zip_path),
+        "manifest_path": str(package_root / "scenes_manifest.json"),
+    }
 
-        _slice_video(raw, video_path, scene.start, scene.end)
-        _slice_audio(raw, audio_path, scene.start, scene.end)
 
-        clipped_srt = _clip_srt(srt_entries, scene.start, scene.end)
-        _write_scene_subtitles(scene_dir, clipped_srt)
+def _workspace_rel(path: Path) -> str:
+    """Return ``path`` relative to the workspace root, or as-is outside it.
 
-        preview = ""
-        for entry in srt_entries:
-            if entry.end > scene.start and entry.start < scene.end:
-                preview = entry.text.splitlines()[0].strip()
-                break
+    Package paths are built from ``workspace_root()`` (already resolved), so
+    a prefix check stands in for ``resolve()`` and its filesystem lookups.
+    """
 
-        scene_payload = {
-            "scene_id": scene_id,
-            "source": {
-                "task_id": task_id,
-                "origin_video": str(raw),
-                "time_range": [round(scene.start, 3), round(scene.end, 3)],
-            },
-            "semantics": {
-                "role": "unknown",
-                "language": source_lang,
-                "summary": preview or "",
-            },
-            "assets": {
-                "video": "video.mp4",
-                "audio": "audio.wav",
-                "subs": "subs.srt",
-            },
-        }
-        scene_json_path.write_text(
-            json.dumps(scene_payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+    root = os.fspath(workspace_root())
+    value = os.fspath(path)
+    if value.startswith(root + os.sep):
+        return value[len(root) + 1 :]
+    return value
 
-        duration = scene.end - scene.start
-        manifest_scenes.append(
-            {
-                "scene_id": scene_id,
-                "start": round(scene.start, 3),
-                "end": round(scene.end, 3),
-                "duration": round(duration, 3),
-                "role": "unknown",
-                "dir": f"scenes/{scene_id}",
-            }
-        )
 
-    try:
-        subs_rel = str(source_srt.resolve().relative_to(workspace_root()))
-    except Exception:
-        subs_rel = str(source_srt)
-    try:
-        raw_rel = str(raw.resolve().relative_to(workspace_root()))
-    except Exception:
-        raw_rel = str(raw)
+def _write_package_index(
+    zf: ZipFile,
+    package_root: Path,
+    arc_root: str,
+    *,
+    task_id: str,
+    raw: Path,
+    source_srt: Path,
+    source_lang: str,
+    manifest_scenes: list[dict],
+) -> None:
+    """Write scenes_manifest.json and README.md to disk and into the zip."""
 
     manifest = {
         "version": "1.8",
@@ -463,37 +916,18 @@ def generate_scenes_package(
         "language": source_lang,
         "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "source": {
-            "raw_video": raw_rel,
-            "subs": subs_rel,
+            "raw_video": _workspace_rel(raw),
+            "subs": _workspace_rel(source_srt),
         },
         "scenes": manifest_scenes,
     }
     manifest_path = package_root / "scenes_manifest.json"
-    manifest_path.write_text(
-        json.dumps(manifest, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    manifest_path.write_bytes(dumps_pretty(manifest))
     readme_path = package_root / "README.md"
     _write_readme(readme_path, task_id)
 
-    zip_path = out_root / "scenes.zip"
-    with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as zf:
-        for item in package_root.rglob("*"):
-            if item.is_file():
-                arcname = Path("deliver") / "scenes" / task_id / item.relative_to(package_root)
-                zf.write(item, arcname=arcname.as_posix())
-
-    storage = get_storage_service()
-    scenes_key = f"deliver/scenes/{task_id}/scenes.zip"
-    storage.upload_file(str(zip_path), scenes_key, content_type="application/zip")
-
-    return {
-        "task_id": task_id,
-        "scenes_key": scenes_key,
-        "scenes_count": len(manifest_scenes),
-        "zip_path": str(zip_path),
-        "manifest_path": str(manifest_path),
-    }
+    zip_write_file(zf, manifest_path, f"{arc_root}/scenes_manifest.json")
+    zip_write_file(zf, readme_path, f"{arc_root}/README.md")
 
 
 def _task_value(task: object, field: str) -> str | None:
@@ -1,25 +1,27 @@
 """Reusable pipeline step functions shared by /v1 routes and background tasks."""
 
 import asyncio
-import json
+import functools
 import logging
 import os
-import re
-import shutil
 import subprocess
-import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
 
 from fastapi import HTTPException
+from sqlalchemy.orm import Session
 
 from gateway.app.ports.storage_provider import get_storage_service
 from gateway.app.core.workspace import (
     Workspace,
     deliver_dir,
     deliver_pack_zip_path,
+    mp3_cache_dir,
     raw_path,
+    relative_to_task_workspace,
     relative_to_workspace,
     translated_srt_path,
 )
@@ -27,9 +29,16 @@ from gateway.app.db import SessionLocal
 from gateway.app import models
 from gateway.app.services.artifact_storage import upload_task_artifact
 from gateway.app.services.dubbing import DubbingError, synthesize_voice
+from gateway.app.services.pack_service import (
+    PackError,
+    write_capcut_pack_zip,
+    write_silence_wav,
+)
 from gateway.app.services.parse import detect_platform, parse_video
 from gateway.app.services.subtitles import generate_subtitles
 from gateway.app.schemas import DubRequest, PackRequest, ParseRequest, SubtitlesRequest
+from gateway.app.utils.binaries import find_binary
+from gateway.app.utils.files import fast_copy, file_digest
 from gateway.app.utils.timing import log_step_timing
 
 logger = logging.getLogger(__name__)
@@ -44,124 +53,239 @@ def _env_int(name: str, default: int) -> int:
     except ValueError:
         return default
 
-# -------------------------
-# Artifact name conventions
-# -------------------------
-# 强制所有 key 都落到 artifacts/ 下，确保 /files/<key> 路径一致、可预期
-RAW_ARTIFACT = "raw/raw.mp4"
-ORIGIN_SRT_ARTIFACT = "subs/origin.srt"
-MM_SRT_ARTIFACT = "subs/mm.srt"
-MM_TXT_ARTIFACT = "subs/mm.txt"
 
-AUDIO_MM_KEY_TEMPLATE = "deliver/tasks/{task_id}/audio_mm.mp3"
+# Step settings, read once at import (like DEFAULT_MM_LANG in pipeline_v1).
+DUB_SKIP = os.getenv("DUB_SKIP", "").strip().lower() in ("1", "true", "yes")
+ASR_BACKEND = os.getenv("ASR_BACKEND") or "whisper"
+SUBTITLES_BACKEND_ENV = os.getenv("SUBTITLES_BACKEND")
+SUBTITLES_BACKEND = SUBTITLES_BACKEND_ENV or "gemini"
+DUB_PROVIDER = os.getenv("DUB_PROVIDER")
+SUBTITLES_STEP_TIMEOUT_SEC = _env_int("SUBTITLES_STEP_TIMEOUT_SEC", 7200)
+DUB_STEP_TIMEOUT_SEC = _env_int("DUB_STEP_TIMEOUT_SEC", 900)
+# Keep the deliver/packs zip on local disk once it is uploaded (publish reads
+# it); 0 deletes it after the upload.
+PACK_LOCAL_ZIP = os.getenv("PACK_LOCAL_ZIP", "1").strip().lower() not in ("0", "false", "no")
+# Storage PUTs/GETs run on their own small pool: they neither queue behind
+# nor crowd out the zip/copy work on the default executor.
+STORAGE_IO_WORKERS = max(1, _env_int("STORAGE_IO_WORKERS", 4))
+_storage_pool = ThreadPoolExecutor(max_workers=STORAGE_IO_WORKERS, thread_name_prefix="storage-io")
 
-README_TEMPLATE = """CapCut pack usage
+# Sniff the audio header so an mp3 saved under another suffix skips ffmpeg.
+MP3_HEADER_SNIFF = os.getenv("MP3_HEADER_SNIFF", "1").strip().lower() not in ("0", "false", "no")
+# Reuse the mp3 of an identical source (dub reruns) instead of re-encoding.
+MP3_CACHE = os.getenv("MP3_CACHE", "1").strip().lower() not in ("0", "false", "no")
+# Least recently used cache entries beyond this count are evicted.
+MP3_CACHE_MAX_FILES = max(1, _env_int("MP3_CACHE_MAX_FILES", 200))
 
-1. Create a new CapCut project and import the extracted zip files.
-2. Place raw/raw.mp4 on the video track.
-3. Import subs/mm.srt and adjust styling.
-4. Place audio/{audio_filename} on the audio track and align with subtitles.
-5. Add transitions or stickers as needed.
-"""
 
+def mp3_cache_path(src_path: Path) -> Path | None:
+    """Cache slot for the mp3 encode of ``src_path``, keyed on its content."""
 
-class PackError(Exception):
-    """Raised when packing fails."""
+    if not MP3_CACHE:
+        return None
+    return mp3_cache_dir() / f"{file_digest(src_path)}.mp3"
 
 
-_SRT_TIME_RE = re.compile(
-    r"\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}"
-)
+def store_mp3_cache(mp3_path: Path, cache_path: Path | None) -> None:
+    """Copy a fresh encode into the cache; a failed store only costs the next hit.
 
+    The slot gets its own copy (not a hardlink): ffmpeg ``-y`` truncates
+    ``dst`` in place on the next encode, which would corrupt a shared inode.
+    """
+
+    if cache_path is None:
+        return
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        fast_copy(mp3_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logger.warning("mp3 cache store failed for %s", cache_path, exc_info=True)
+        tmp_path.unlink(missing_ok=True)
+        return
+    _evict_mp3_cache(cache_path.parent)
 
-def _srt_to_txt(srt_text: str) -> str:
-    blocks = [b for b in srt_text.split("\n\n") if b.strip()]
-    lines_out: list[str] = []
-    for block in blocks:
-        text_lines: list[str] = []
-        for line in block.splitlines():
-            s = line.strip()
-            if not s:
-                continue
-            if s.isdigit():
-                continue
-            if "-->" in s or _SRT_TIME_RE.search(s):
-                continue
-            text_lines.append(s)
-        if text_lines:
-            lines_out.append(" ".join(text_lines))
-    return "\n".join(lines_out).strip() + ("\n" if lines_out else "")
 
+def _evict_mp3_cache(cache_dir: Path) -> None:
+    """Drop the least recently used entries past ``MP3_CACHE_MAX_FILES``.
 
-def _ensure_txt_from_srt(dst_txt: Path, src_srt: Path) -> None:
-    srt_text = src_srt.read_text(encoding="utf-8")
-    dst_txt.write_text(_srt_to_txt(srt_text), encoding="utf-8")
+    Hits refresh an entry's mtime, so mtime order is use order.
+    """
 
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [
+                (entry.stat().st_mtime_ns, entry.path)
+                for entry in it
+                if entry.name.endswith(".mp3") and not entry.name.startswith(".")
+            ]
+    except OSError:
+        return
+    if len(entries) <= MP3_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _mtime, path in entries[: len(entries) - MP3_CACHE_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
-def _ensure_silence_audio_ffmpeg(out_path: Path, seconds: int = 1) -> None:
-    """Create a silent WAV via ffmpeg."""
 
-    ffmpeg = shutil.which("ffmpeg")
-    if not ffmpeg:
-        raise PackError("ffmpeg not found in PATH (required). Please install ffmpeg.")
+def detect_audio_kind(path: Path) -> str:
+    """Classify audio by its first bytes: "mp3", "aac", "wav" or "other"."""
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
+    try:
+        with path.open("rb") as fh:
+            head = fh.read(12)
+    except OSError:
+        return "other"
+    if head[:3] == b"ID3":
+        return "mp3"
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+        # ADTS shares the frame sync; its layer bits are 00, MPEG layer III is 01.
+        if head[1] & 0xF6 == 0xF0:
+            return "aac"
+        if head[1] & 0x06 == 0x02:
+            return "mp3"
+        return "other"
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    return "other"
+
+
+def mp3_encode_cmd(ffmpeg: str, src_path: Path, dst_path: Path) -> list[str]:
+    """ffmpeg argv for the voice-track mp3 (libmp3lame defaults, errors-only log)."""
+
+    return [
         ffmpeg,
+        "-hide_banner",
+        "-nostats",
+        "-loglevel",
+        "error",
         "-y",
-        "-f",
-        "lavfi",
         "-i",
-        "anullsrc=r=16000:cl=mono",
-        "-t",
-        str(seconds),
-        "-acodec",
-        "pcm_s16le",
-        str(out_path),
+        str(src_path),
+        "-vn",
+        "-codec:a",
+        "libmp3lame",
+        str(dst_path),
     ]
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if p.returncode != 0 or not out_path.exists() or out_path.stat().st_size == 0:
-        raise PackError(f"ffmpeg silence generation failed: {p.stderr[-800:]}")
 
 
-def _ensure_mp3_audio(src_path: Path, dst_path: Path) -> Path:
+def ensure_mp3_audio(src_path: Path, dst_path: Path) -> Path:
+    """Return an mp3 of ``src_path``, encoding to ``dst_path`` only when needed.
+
+    An mp3 source (by suffix or header) and a cached encode of identical
+    audio are used as-is; otherwise ffmpeg encodes and the result is cached.
+    Blocking: async callers run it in a thread. Raises :class:`PackError`.
+    """
+
     if src_path.suffix.lower() == ".mp3":
         return src_path
-
-    ffmpeg = shutil.which("ffmpeg")
+    if MP3_HEADER_SNIFF and detect_audio_kind(src_path) == "mp3":
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        fast_copy(src_path, dst_path)
+        return dst_path
+
+    cache_path = mp3_cache_path(src_path)
+    if cache_path is not None and cache_path.exists():
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        fast_copy(cache_path, dst_path)
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return dst_path
+
+    ffmpeg = find_binary("ffmpeg")
     if not ffmpeg:
         raise PackError("ffmpeg not found in PATH (required for mp3 conversion).")
 
     dst_path.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        ffmpeg,
-        "-y",
-        "-i",
-        str(src_path),
-        "-codec:a",
-        "libmp3lame",
-        str(dst_path),
-    ]
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    p = subprocess.run(
+        mp3_encode_cmd(ffmpeg, src_path, dst_path),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
     if p.returncode != 0 or not dst_path.exists() or dst_path.stat().st_size == 0:
         raise PackError(f"ffmpeg mp3 conversion failed: {p.stderr[-800:]}")
+    store_mp3_cache(dst_path, cache_path)
     return dst_path
 
 
-def _maybe_fill_missing_for_pack(*, raw_path: Path, audio_path: Path, subs_path: Path) -> None:
-    """Allow pack to proceed by generating silence audio if DUB_SKIP=1."""
+# -------------------------
+# Artifact name conventions
+# -------------------------
+# 强制所有 key 都落到 artifacts/ 下，确保 /files/<key> 路径一致、可预期
+RAW_ARTIFACT = "raw/raw.mp4"
+ORIGIN_SRT_ARTIFACT = "subs/origin.srt"
+MM_SRT_ARTIFACT = "subs/mm.srt"
+MM_TXT_ARTIFACT = "subs/mm.txt"
+
+AUDIO_MM_KEY_TEMPLATE = "deliver/tasks/{task_id}/audio_mm.mp3"
+
+_outer_session: ContextVar[Session | None] = ContextVar("steps_v1_outer_session", default=None)
+
+
+@contextmanager
+def use_step_session(db: Session):
+    """Let the steps run inside this block reuse ``db`` (e.g. the pipeline's)."""
+
+    token = _outer_session.set(db)
+    try:
+        yield db
+    finally:
+        _outer_session.reset(token)
+
+
+@contextmanager
+def step_session():
+    """The session a step runs with: the caller's, else a fresh one."""
+
+    db = _outer_session.get()
+    if db is None:
+        with SessionLocal() as db:
+            yield db
+        return
+    # Task refs cached by an earlier step may predate writes made since.
+    db.info.pop("task_refs", None)
+    yield db
+
+
+async def _storage_io(fn, *args, **kwargs):
+    """Run a blocking storage call on the bounded storage pool."""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_storage_pool, functools.partial(fn, *args, **kwargs))
+
 
-    dub_skip = os.getenv("DUB_SKIP", "").strip().lower() in ("1", "true", "yes")
-    if not dub_skip:
+def _maybe_fill_missing_for_pack(*, audio_path: Path, present: set[str]) -> None:
+    """Allow pack to proceed by generating silence audio if DUB_SKIP=1.
+
+    ``present`` is the pack step's workspace snapshot; it is updated in place.
+    """
+
+    if not DUB_SKIP:
         return
 
-    if audio_path and not audio_path.exists():
-        _ensure_silence_audio_ffmpeg(audio_path, seconds=1)
+    audio_rel = f"audio/{audio_path.name}"
+    if audio_path and audio_rel not in present:
+        write_silence_wav(audio_path, seconds=1)
+        present.add(audio_rel)
 
 
 async def run_parse_step(req: ParseRequest):
     """Run the parse step for the given request."""
 
+    # One session per step: helpers share it instead of opening their own.
+    with step_session() as db:
+        return await _parse_step(req, db)
+
+
+async def _parse_step(req: ParseRequest, db: Session):
+
     start_time = time.perf_counter()
     platform = None
     try:
@@ -174,11 +298,14 @@ async def run_parse_step(req: ParseRequest):
 
         raw_file = raw_path(req.task_id)
         raw_key = None
-        if raw_file.exists():
-            raw_key = _upload_artifact(req.task_id, raw_file, RAW_ARTIFACT)
+        # parse_video already stat'ed the download; reuse its answer.
+        if result.get("raw_exists"):
+            raw_key = await _upload_artifact_async(req.task_id, raw_file, RAW_ARTIFACT, db=db)
+            result["raw_task_path"] = relative_to_task_workspace(raw_file, req.task_id)
 
         _update_task(
             req.task_id,
+            db=db,
             raw_path=raw_key,
             platform=(result.get("platform") or platform),
             last_step="parse",
@@ -186,11 +313,11 @@ async def run_parse_step(req: ParseRequest):
         return result
 
     except HTTPException as exc:
-        _update_task(req.task_id, parse_status="error", parse_error=str(exc.detail))
+        _update_task(req.task_id, parse_status="error", parse_error=str(exc.detail), db=db)
         raise
     except Exception as exc:  # pragma: no cover
         logger.exception("Unexpected error in parse step for task %s", req.task_id)
-        _update_task(req.task_id, parse_status="error", parse_error=str(exc))
+        _update_task(req.task_id, parse_status="error", parse_error=str(exc), db=db)
         raise HTTPException(status_code=500, detail=f"Unexpected server error: {exc}") from exc
     finally:
         log_step_timing(
@@ -205,9 +332,16 @@ async def run_parse_step(req: ParseRequest):
 async def run_subtitles_step(req: SubtitlesRequest):
     """Run the subtitles step for the given request."""
 
+    # One session per step: helpers share it instead of opening their own.
+    with step_session() as db:
+        return await _subtitles_step(req, db)
+
+
+async def _subtitles_step(req: SubtitlesRequest, db: Session):
+
     start_time = time.perf_counter()
-    asr_backend = os.getenv("ASR_BACKEND") or "whisper"
-    subtitles_backend = os.getenv("SUBTITLES_BACKEND") or "gemini"
+    asr_backend = ASR_BACKEND
+    subtitles_backend = SUBTITLES_BACKEND
     logger.info(
         "SUB2_START",
         extra={
@@ -220,8 +354,7 @@ async def run_subtitles_step(req: SubtitlesRequest):
         },
     )
     try:
-        _update_task(req.task_id, subtitles_status="running", subtitles_error=None)
-        step_timeout_sec = _env_int("SUBTITLES_STEP_TIMEOUT_SEC", 7200)
+        _update_task(req.task_id, subtitles_status="running", subtitles_error=None, db=db)
         result = await asyncio.wait_for(
             generate_subtitles(
                 task_id=req.task_id,
@@ -230,38 +363,45 @@ async def run_subtitles_step(req: SubtitlesRequest):
                 translate_enabled=req.translate,
                 use_ffmpeg_extract=True,
             ),
-            timeout=step_timeout_sec,
+            timeout=SUBTITLES_STEP_TIMEOUT_SEC,
         )
 
         workspace = Workspace(req.task_id)
 
-        origin_key = None
-        mm_key = None
-        mm_txt_key = None
-
-        if workspace.origin_srt_path.exists():
-            origin_key = _upload_artifact(req.task_id, workspace.origin_srt_path, ORIGIN_SRT_ARTIFACT)
-
         # 你的 Workspace 里 mm_srt_path / mm_srt_exists() 可能有差异，这里按“路径存在”判断
-        if workspace.mm_srt_path.exists():
-            mm_key = _upload_artifact(req.task_id, workspace.mm_srt_path, MM_SRT_ARTIFACT)
+        origin_exists = workspace.origin_srt_path.exists()
+        mm_exists = workspace.mm_srt_path.exists()
+        mm_txt_path = workspace.mm_srt_path.with_suffix(".txt")
+        mm_txt_exists = mm_exists and mm_txt_path.exists()
 
-            mm_txt_path = workspace.mm_srt_path.with_suffix(".txt")
-            if mm_txt_path.exists():
-                mm_txt_key = _upload_artifact(req.task_id, mm_txt_path, MM_TXT_ARTIFACT)
+        async def _upload(exists: bool, local_path: Path, artifact_name: str) -> str | None:
+            if not exists:
+                return None
+            return await _upload_artifact_async(req.task_id, local_path, artifact_name, db=db)
 
         subtitles_dir = deliver_dir() / "subtitles" / req.task_id
         subtitles_dir.mkdir(parents=True, exist_ok=True)
-        if workspace.origin_srt_path.exists():
-            shutil.copy2(workspace.origin_srt_path, subtitles_dir / "origin.srt")
-        if workspace.mm_srt_path.exists():
-            shutil.copy2(workspace.mm_srt_path, subtitles_dir / "mm.srt")
-        if workspace.segments_json.exists():
-            shutil.copy2(workspace.segments_json, subtitles_dir / "subtitles.json")
+        copies = [
+            (src, subtitles_dir / name)
+            for src, name in (
+                (workspace.origin_srt_path, "origin.srt"),
+                (workspace.mm_srt_path, "mm.srt"),
+                (workspace.segments_json, "subtitles.json"),
+            )
+            if src.exists()
+        ]
+        # Uploads and deliver copies are independent; overlap all of them.
+        origin_key, mm_key, mm_txt_key, *_ = await asyncio.gather(
+            _upload(origin_exists, workspace.origin_srt_path, ORIGIN_SRT_ARTIFACT),
+            _upload(mm_exists, workspace.mm_srt_path, MM_SRT_ARTIFACT),
+            _upload(mm_txt_exists, mm_txt_path, MM_TXT_ARTIFACT),
+            *(asyncio.to_thread(fast_copy, src, dst) for src, dst in copies),
+        )
         subtitles_key = relative_to_workspace(subtitles_dir / "subtitles.json")
 
         _update_task(
             req.task_id,
+            db=db,
             origin_srt_path=origin_key,
             mm_srt_path=mm_key,
             last_step="subtitles",
@@ -288,14 +428,15 @@ async def run_subtitles_step(req: SubtitlesRequest):
         return result
 
     except asyncio.TimeoutError:
-        _update_task(req.task_id, subtitles_status="error", subtitles_error="timeout")
+        _update_task(req.task_id, subtitles_status="error", subtitles_error="timeout", db=db)
         raise HTTPException(status_code=504, detail="subtitles timeout")
     except asyncio.CancelledError:
-        _update_task(req.task_id, subtitles_status="error", subtitles_error="cancelled")
+        _update_task(req.task_id, subtitles_status="error", subtitles_error="cancelled", db=db)
         raise
     except HTTPException as exc:
         _update_task(
             req.task_id,
+            db=db,
             subtitles_status="error",
             subtitles_error=f"{exc.status_code}: {exc.detail}",
         )
@@ -312,27 +453,36 @@ async def run_subtitles_step(req: SubtitlesRequest):
         raise
     except Exception as exc:  # pragma: no cover
         logger.exception("Unexpected error in subtitles step for task %s", req.task_id)
-        _update_task(req.task_id, subtitles_status="error", subtitles_error=str(exc))
+        _update_task(req.task_id, subtitles_status="error", subtitles_error=str(exc), db=db)
         raise HTTPException(status_code=500, detail="internal error") from exc
     finally:
-        provider = os.getenv("SUBTITLES_BACKEND", None)
         log_step_timing(
             logger,
             task_id=req.task_id,
             step="subtitles",
             start_time=start_time,
-            provider=provider,
+            provider=SUBTITLES_BACKEND_ENV,
         )
 
 
 async def run_dub_step(req: DubRequest):
     """Run the dubbing step for the given request."""
 
+    # One session per step: helpers share it instead of opening their own.
+    with step_session() as db:
+        return await _dub_step(req, db)
+
+
+async def _dub_step(req: DubRequest, db: Session):
+
     start_time = time.perf_counter()
-    provider = os.getenv("DUB_PROVIDER", None)
+    provider = DUB_PROVIDER
     workspace = Workspace(req.task_id)
-    origin_exists = workspace.origin_srt_path.exists()
-    mm_exists = workspace.mm_srt_exists()
+    # One scandir answers both existence checks and picks the mm/my file.
+    present = workspace.snapshot("subs")
+    origin_exists = "subs/origin.srt" in present
+    mm_srt_path = workspace.mm_srt_path_in(present)
+    mm_exists = mm_srt_path is not None
 
     logger.info(
         "Dub request",
@@ -340,7 +490,7 @@ async def run_dub_step(req: DubRequest):
             "task_id": req.task_id,
             "origin_srt_exists": origin_exists,
             "mm_srt_exists": mm_exists,
-            "mm_srt_path": str(workspace.mm_srt_path),
+            "mm_srt_path": str(mm_srt_path or workspace.mm_srt_path),
         },
     )
     logger.info(
@@ -358,11 +508,16 @@ async def run_dub_step(req: DubRequest):
     try:
         if not mm_exists:
             detail = "translated subtitles not found; run /api/tasks/{task_id}/subtitles first"
-            _update_task(req.task_id, dub_status="error", dub_error=detail)
+            _update_task(req.task_id, dub_status="error", dub_error=detail, db=db)
             raise HTTPException(status_code=400, detail=detail)
 
         override_text = (req.mm_text or "").strip()
-        mm_text = override_text or (workspace.read_mm_srt_text() or "")
+        mm_text = override_text
+        if not mm_text:
+            try:
+                mm_text = mm_srt_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                mm_text = ""
         logger.info(
             "DUB3_TEXT_SOURCE",
             extra={
@@ -378,10 +533,9 @@ async def run_dub_step(req: DubRequest):
         )
         if not mm_text.strip():
             detail = "translated subtitles file is empty; please rerun /api/tasks/{task_id}/subtitles"
-            _update_task(req.task_id, dub_status="error", dub_error=detail)
+            _update_task(req.task_id, dub_status="error", dub_error=detail, db=db)
             raise HTTPException(status_code=400, detail=detail)
 
-        step_timeout_sec = _env_int("DUB_STEP_TIMEOUT_SEC", 900)
         result = await asyncio.wait_for(
             synthesize_voice(
                 task_id=req.task_id,
@@ -391,20 +545,21 @@ async def run_dub_step(req: DubRequest):
                 mm_srt_text=mm_text,
                 workspace=workspace,
             ),
-            timeout=step_timeout_sec,
+            timeout=DUB_STEP_TIMEOUT_SEC,
         )
     except asyncio.TimeoutError:
-        _update_task(req.task_id, dub_status="error", dub_error="timeout")
+        _update_task(req.task_id, dub_status="error", dub_error="timeout", db=db)
         raise HTTPException(status_code=504, detail="dub timeout")
     except asyncio.CancelledError:
-        _update_task(req.task_id, dub_status="error", dub_error="cancelled")
+        _update_task(req.task_id, dub_status="error", dub_error="cancelled", db=db)
         raise
     except DubbingError as exc:
-        _update_task(req.task_id, dub_status="error", dub_error=str(exc))
+        _update_task(req.task_id, dub_status="error", dub_error=str(exc), db=db)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except HTTPException as exc:
         _update_task(
             req.task_id,
+            db=db,
             dub_status="error",
             dub_error=f"{exc.status_code}: {exc.detail}",
         )
@@ -423,6 +578,7 @@ async def run_dub_step(req: DubRequest):
     # synthesize_voice 可能返回 dict 或其他对象，这里做防御性解析
     audio_path_value = result.get("audio_path") if isinstance(result, dict) else None
     audio_key = None
+    mm_audio_task_path = None
 
     if audio_path_value:
         p = Path(audio_path_value)
@@ -431,17 +587,19 @@ async def run_dub_step(req: DubRequest):
             p = workspace.mm_audio_path
 
         if p.exists():
-            mp3_path = _ensure_mp3_audio(p, workspace.mm_audio_mp3_path)
+            mm_audio_task_path = relative_to_task_workspace(p, req.task_id)
+            mp3_path = await asyncio.to_thread(ensure_mp3_audio, p, workspace.mm_audio_mp3_path)
             key_template = AUDIO_MM_KEY_TEMPLATE.format(task_id=req.task_id)
             storage = get_storage_service()
-            uploaded_key = storage.upload_file(
+            uploaded_key = await _storage_io(
+                storage.upload_file,
                 str(mp3_path),
                 key_template,
                 content_type="audio/mpeg",
             )
             if not uploaded_key:
                 detail = "Audio upload failed; no storage key returned"
-                _update_task(req.task_id, dub_status="error", dub_error=detail)
+                _update_task(req.task_id, dub_status="error", dub_error=detail, db=db)
                 raise HTTPException(status_code=500, detail=detail)
             audio_key = uploaded_key
             logger.info(
@@ -461,6 +619,7 @@ async def run_dub_step(req: DubRequest):
     if audio_key:
         _update_task(
             req.task_id,
+            db=db,
             mm_audio_path=audio_key,
             mm_audio_key=audio_key,
             last_step="dub",
@@ -473,7 +632,7 @@ async def run_dub_step(req: DubRequest):
         mm_txt_path = workspace.mm_txt_path
         mm_txt_path.parent.mkdir(parents=True, exist_ok=True)
         mm_txt_path.write_text(edited_text, encoding="utf-8")
-        _upload_artifact(req.task_id, mm_txt_path, MM_TXT_ARTIFACT)
+        await _upload_artifact_async(req.task_id, mm_txt_path, MM_TXT_ARTIFACT, db=db)
 
     try:
         audio_url = f"/v1/tasks/{req.task_id}/audio_mm"
@@ -483,6 +642,7 @@ async def run_dub_step(req: DubRequest):
             "audio_mm_url": audio_url,
             "duration_sec": result.get("duration_sec") if isinstance(result, dict) else None,
             "audio_path": (result.get("audio_path") or result.get("path")) if isinstance(result, dict) else None,
+            "mm_audio_task_path": mm_audio_task_path,
         }
         logger.info(
             "DUB3_DONE",
@@ -511,6 +671,13 @@ async def run_dub_step(req: DubRequest):
 async def run_pack_step(req: PackRequest):
     """Run the packaging step for the given request."""
 
+    # One session per step: helpers share it instead of opening their own.
+    with step_session() as db:
+        return await _pack_step(req, db)
+
+
+async def _pack_step(req: PackRequest, db: Session):
+
     start_time = time.perf_counter()
     task_id = req.task_id
     workspace = Workspace(task_id)
@@ -518,101 +685,62 @@ async def run_pack_step(req: PackRequest):
     raw_file = raw_path(task_id)
     zip_path = deliver_pack_zip_path(task_id)
     zip_path.parent.mkdir(parents=True, exist_ok=True)
+    # One scandir per input dir; the lookups below test names in this set
+    # instead of stat'ing each candidate (slow on network filesystems).
+    present = workspace.snapshot("raw", "audio", "subs")
+    zip_key = f"packs/{task_id}/capcut_pack.zip"
+    storage = get_storage_service()
 
     # audio：优先 workspace.mm_audio_path（你的 dub 可能输出 mp3），不存在则 fallback 到 wav 命名
-    audio_file = workspace.mm_audio_path
-    audio_key = _get_task_mm_audio_key(task_id)
-    if audio_key and not audio_file.exists():
-        storage = get_storage_service()
+    audio_file = workspace.mm_audio_path_in(present)
+    audio_key = _get_task_mm_audio_key(task_id, db=db)
+    if audio_key and audio_file is None:
         target_path = workspace.mm_audio_mp3_path
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        storage.download_file(audio_key, str(target_path))
+        await _storage_io(storage.download_file, audio_key, str(target_path))
         audio_file = target_path
-    if not audio_file.exists():
-        wav_candidate = (workspace.audio_dir / f"{task_id}_mm_vo.wav") if hasattr(workspace, "audio_dir") else None
-        if wav_candidate and wav_candidate.exists():
-            audio_file = wav_candidate
+        present.add(f"audio/{target_path.name}")
+    if audio_file is None:
+        audio_file = workspace.mm_audio_legacy_path
 
     # subs：优先 translated_srt_path(task_id, "my")，fallback "mm"
-    subs_mm_srt = translated_srt_path(task_id, "my")
-    if not subs_mm_srt.exists():
-        subs_mm_srt = translated_srt_path(task_id, "mm")
+    subs_lang = "my" if "subs/my.srt" in present else "mm"
+    subs_mm_srt = translated_srt_path(task_id, subs_lang)
     try:
-        _maybe_fill_missing_for_pack(
-            raw_path=raw_file,
-            audio_path=audio_file,
-            subs_path=subs_mm_srt,
-        )
+        _maybe_fill_missing_for_pack(audio_path=audio_file, present=present)
 
         required = [raw_file, audio_file, subs_mm_srt]
-        missing = [p for p in required if not p.exists()]
+        missing = [p for p in required if f"{p.parent.name}/{p.name}" not in present]
         if missing:
             names = ", ".join(str(p) for p in missing)
             raise PackError(f"missing required files: {names}")
 
         audio_filename = audio_file.name
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir) / f"pack_{task_id}"
-            tmp_path.mkdir(parents=True, exist_ok=True)
-
-            raw_dir = tmp_path / "raw"
-            audio_dir = tmp_path / "audio"
-            subs_dir = tmp_path / "subs"
-            scenes_dir = tmp_path / "scenes"
-            for d in (raw_dir, audio_dir, subs_dir, scenes_dir):
-                d.mkdir(parents=True, exist_ok=True)
-
-            audio_ext = audio_file.suffix if audio_file.suffix else ".wav"
-            audio_filename = f"voice_my{audio_ext}"
-
-            shutil.copy(raw_file, raw_dir / "raw.mp4")
-            shutil.copy(audio_file, audio_dir / audio_filename)
-            shutil.copy(subs_mm_srt, subs_dir / "mm.srt")
+        audio_ext = audio_file.suffix if audio_file.suffix else ".wav"
+        audio_filename = f"voice_my{audio_ext}"
 
-            mm_txt_path = subs_mm_srt.with_suffix(".txt")
-            if mm_txt_path.exists():
-                shutil.copy(mm_txt_path, subs_dir / "mm.txt")
-            else:
-                _ensure_txt_from_srt(subs_dir / "mm.txt", subs_mm_srt)
-
-            (scenes_dir / ".keep").write_text("", encoding="utf-8")
-
-            manifest = {
-                "version": "1.8",
-                "pack_type": "capcut_v18",
-                "task_id": task_id,
-                "language": "my",
-                "assets": {
-                    "raw_video": "raw/raw.mp4",
-                    "voice": f"audio/{audio_filename}",
-                    "subtitle": "subs/mm.srt",
-                    "scenes_dir": "scenes/",
-                },
-            }
-            (tmp_path / "manifest.json").write_text(
-                json.dumps(manifest, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-            (tmp_path / "README.md").write_text(
-                README_TEMPLATE.format(audio_filename=audio_filename),
-                encoding="utf-8",
+        zip_inputs = dict(
+            raw_file=raw_file,
+            audio_file=audio_file,
+            audio_filename=audio_filename,
+            subs_mm_srt=subs_mm_srt,
+            mm_txt_path=(
+                subs_mm_srt.with_suffix(".txt") if f"subs/{subs_lang}.txt" in present else None
+            ),
+        )
+        # Zip to a seekable local file, then upload it: an unseekable upload
+        # stream would give every entry a data descriptor (see open_media_zip).
+        await asyncio.to_thread(write_capcut_pack_zip, zip_path, task_id, **zip_inputs)
+        try:
+            await _storage_io(
+                storage.upload_file, str(zip_path), zip_key, content_type="application/zip"
             )
-
-            pack_prefix = Path("deliver") / "packs" / task_id
-            with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as zf:
-                for item in tmp_path.rglob("*"):
-                    if item.is_file():
-                        arcname = (pack_prefix / item.relative_to(tmp_path)).as_posix()
-                        zf.write(item, arcname=arcname)
+        finally:
+            if not PACK_LOCAL_ZIP:
+                zip_path.unlink(missing_ok=True)
     except PackError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    if not zip_path.exists():
-        raise RuntimeError(f"Pack zip not found after packing: {zip_path}")
-
-    zip_key = f"packs/{task_id}/capcut_pack.zip"
-    storage = get_storage_service()
-    storage.upload_file(str(zip_path), zip_key, content_type="application/zip")
 
     files = [
         f"deliver/packs/{task_id}/raw/raw.mp4",
@@ -627,9 +755,11 @@ async def run_pack_step(req: PackRequest):
     # 更新任务：pack_path 必须存 key（供 /v1/tasks/{id}/pack 302 → /files/<key>）
     _update_task(
         task_id,
+        db=db,
         pack_key=zip_key,
         pack_type="capcut_v18",
         pack_status="ready",
+        pack_error=None,
         pack_path=None,
         status="ready",
         last_step="pack",
@@ -638,6 +768,7 @@ async def run_pack_step(req: PackRequest):
     )
 
     # 返回值对 UI/调试友好：保留 zip_path/files
+    # The zip was either written (and uploaded) or the step raised above.
     zip_path_value = relative_to_workspace(zip_path) if zip_path.exists() else None
     try:
         download_url = storage.generate_presigned_url(
@@ -668,46 +799,88 @@ async def run_pack_step(req: PackRequest):
         )
 
 
-def _update_task(task_id: str, **fields) -> None:
+def _update_task(task_id: str, *, db: Session | None = None, **fields) -> None:
     """
     注意：这里允许把字段显式更新为 None（例如清理 error_message / error_reason）。
     只要调用方传了 key，就会写入数据库。
     """
-    db = SessionLocal()
-    try:
-        task = db.query(models.Task).filter(models.Task.id == task_id).first()
-        if not task:
-            return
-        for key, value in fields.items():
-            if hasattr(task, key):
-                setattr(task, key, value)
-        db.commit()
-    finally:
-        db.close()
+    # repo_sql imports models, and models imports db, which imports repo_sql:
+    # importing it at module load breaks when this module is imported first.
+    from gateway.app.adapters.repo_sql import update_task_fields
 
+    if db is not None:
+        update_task_fields(db, task_id, fields)
+        return
+    with SessionLocal() as session:
+        update_task_fields(session, task_id, fields)
 
-def _upload_artifact(task_id: str, local_path: Path, artifact_name: str) -> str | None:
+
+def _task_ref(db: Session, task_id: str) -> dict | None:
+    """Task fields the steps read, loaded once per session.
+
+    A plain dict survives the commits made by ``_update_task``; the ORM row
+    would be expired and re-selected on every access after a commit.
+    """
+
+    refs = db.info.setdefault("task_refs", {})
+    if task_id not in refs:
+        task = db.get(models.Task, task_id)
+        refs[task_id] = None
+        if task is not None:
+            refs[task_id] = {
+                "task_id": task_id,
+                "tenant_id": task.tenant_id,
+                "project_id": task.project_id,
+                "mm_audio_key": task.mm_audio_key,
+                "mm_audio_path": task.mm_audio_path,
+            }
+    return refs[task_id]
+
+
+def _upload_artifact(
+    task_id: str,
+    local_path: Path,
+    artifact_name: str,
+    *,
+    db: Session | None = None,
+) -> str | None:
     """
     返回 storage key（例如 default/default/<task_id>/artifacts/xxx）。
     """
-    db = SessionLocal()
-    try:
-        task = db.query(models.Task).filter(models.Task.id == task_id).first()
-        if not task:
-            return None
+    if db is None:
+        with SessionLocal() as session:
+            return _upload_artifact(task_id, local_path, artifact_name, db=session)
+
+    task = _task_ref(db, task_id)
+    if not task:
+        return None
+    # 关键：不要再额外传 task_id=...，避免 wrapper 内部签名变化导致重复参数
+    return upload_task_artifact(task, local_path, artifact_name)
+
+
+async def _upload_artifact_async(
+    task_id: str,
+    local_path: Path,
+    artifact_name: str,
+    *,
+    db: Session,
+) -> str | None:
+    """Run ``_upload_artifact`` on the storage pool so the PUT does not block the loop.
+
+    The task fields are loaded on the calling thread first; the worker then
+    only reads the cached dict and never touches the session.
+    """
 
-        # 关键：不要再额外传 task_id=...，避免 wrapper 内部签名变化导致重复参数
-        return upload_task_artifact(task, local_path, artifact_name)
-    finally:
-        db.close()
+    _task_ref(db, task_id)
+    return await _storage_io(_upload_artifact, task_id, local_path, artifact_name, db=db)
 
 
-def _get_task_mm_audio_key(task_id: str) -> str | None:
-    db = SessionLocal()
-    try:
-        task = db.query(models.Task).filter(models.Task.id == task_id).first()
-        if not task:
-            return None
-        return getattr(task, "mm_audio_key", None) or getattr(task, "mm_audio_path", None)
-    finally:
-        db.close()
+def _get_task_mm_audio_key(task_id: str, *, db: Session | None = None) -> str | None:
+    if db is None:
+        with SessionLocal() as session:
+            return _get_task_mm_audio_key(task_id, db=session)
+
+    task = _task_ref(db, task_id)
+    if not task:
+        return None
+    return task["mm_audio_key"] or task["mm_audio_path"]
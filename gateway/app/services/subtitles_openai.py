@@ -1,4 +1,3 @@
-import re
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -6,6 +5,7 @@ from typing import Optional
 from openai import OpenAI
 
 from gateway.app.config import get_settings
+from gateway.app.core.subtitle_utils import srt_to_txt
 from gateway.app.core.workspace import (
     audio_wav_path,
     origin_srt_path,
@@ -20,33 +20,19 @@ class SubtitleError(Exception):
     """Raised when subtitle processing fails."""
 
 
-_SRT_TIME_RE = re.compile(
-    r"\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}"
-)
-
+def _write_srt(path: Path, srt_text: str) -> None:
+    """Write an SRT and its .txt from the same in-memory text."""
 
-def _srt_to_txt(srt_text: str) -> str:
-    blocks = [b for b in srt_text.split("\n\n") if b.strip()]
-    lines_out: list[str] = []
-    for block in blocks:
-        text_lines: list[str] = []
-        for line in block.splitlines():
-            s = line.strip()
-            if not s:
-                continue
-            if s.isdigit():
-                continue
-            if "-->" in s or _SRT_TIME_RE.search(s):
-                continue
-            text_lines.append(s)
-        if text_lines:
-            lines_out.append(" ".join(text_lines))
-    return "\n".join(lines_out).strip() + ("\n" if lines_out else "")
+    path.write_text(srt_text, encoding="utf-8")
+    path.with_suffix(".txt").write_text(srt_to_txt(srt_text), encoding="utf-8")
 
 
-def _write_txt_from_srt(path: Path) -> None:
-    srt_text = path.read_text(encoding="utf-8")
-    path.with_suffix(".txt").write_text(_srt_to_txt(srt_text), encoding="utf-8")
+def _ensure_txt_from_srt(path: Path) -> None:
+    # Fresh SRTs get their .txt in _write_srt; only a reused SRT from an
+    # older run may still lack one.
+    txt_path = path.with_suffix(".txt")
+    if not txt_path.exists():
+        txt_path.write_text(srt_to_txt(path.read_text(encoding="utf-8")), encoding="utf-8")
 
 
 def preview_lines(text: str, limit: int = 5) -> list[str]:
@@ -84,7 +70,7 @@ def transcribe(task_id: str, raw: Path, force: bool = False) -> Path:
             response_format="srt",
         )
     srt_text = transcription.text if hasattr(transcription, "text") else str(transcription)
-    origin_srt.write_text(srt_text, encoding="utf-8")
+    _write_srt(origin_srt, srt_text)
     return origin_srt
 
 
@@ -98,6 +84,10 @@ def transcribe_with_ffmpeg(task_id: str, raw: Path, force: bool = False) -> tupl
     wav_path.parent.mkdir(parents=True, exist_ok=True)
     cmd = [
         "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-loglevel",
+        "error",
         "-y",
         "-i",
         str(raw),
@@ -121,7 +111,7 @@ def transcribe_with_ffmpeg(task_id: str, raw: Path, force: bool = False) -> tupl
             response_format="srt",
         )
     srt_text = transcription.text if hasattr(transcription, "text") else str(transcription)
-    origin_srt.write_text(srt_text, encoding="utf-8")
+    _write_srt(origin_srt, srt_text)
     return origin_srt, wav_path
 
 
@@ -151,7 +141,7 @@ def translate(task_id: str, origin_srt: Path, target_lang: str, force: bool = Fa
     translated = completion.choices[0].message.content or ""
     if not translated.strip():
         raise SubtitleError("translation returned empty content")
-    target_srt.write_text(translated, encoding="utf-8")
+    _write_srt(target_srt, translated)
     return target_srt
 
 
@@ -186,8 +176,8 @@ async def generate_with_openai(
     translated_srt: Optional[Path] = None
     if translate_enabled:
         translated_srt = translate(task_id, origin_srt, target_lang, force=force)
-        _write_txt_from_srt(translated_srt)
-    _write_txt_from_srt(origin_srt)
+        _ensure_txt_from_srt(translated_srt)
+    _ensure_txt_from_srt(origin_srt)
 
     return {
         "task_id": task_id,
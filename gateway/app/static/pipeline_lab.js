@@ -149,8 +149,8 @@
   }
 
   async function waitForStepReady(id, stepKey) {
-    const statusKey = stepKey === "dub" ? "dub_status" : "subtitles_status";
-    const errorKey = stepKey === "dub" ? "dub_error" : "subtitles_error";
+    const statusKey = `${stepKey}_status`;
+    const errorKey = `${stepKey}_error`;
     while (true) {
       await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
       const status = await fetchJson(`/v1/tasks/${id}/status`, { method: "GET" });
@@ -347,11 +347,15 @@
     const body = { task_id: taskId() };
     log(`Calling /v1/pack for ${body.task_id}.`);
     try {
-      const json = await fetchJson("/v1/pack", {
+      let { status, json } = await fetchJsonWithStatus("/v1/pack", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify(body),
       });
+      if (status === 202 || json.queued) {
+        log("Pack queued; waiting for it to finish...");
+        json = await waitForStepReady(body.task_id, "pack");
+      }
       const output = getEl("packOutput");
       if (output) output.textContent = JSON.stringify(json, null, 2);
       updateDownloadLinks(body.task_id);
@@ -5,7 +5,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from datetime import datetime
+import threading
+from typing import Any
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
@@ -14,19 +15,21 @@ from gateway.app.config import get_settings
 from gateway.app.db import SessionLocal, engine
 from gateway.app.core.workspace import (
     Workspace,
+    audio_dir,
     get_task_workspace,
-    raw_path,
     relative_to_task_workspace,
-    relative_to_workspace,
 )
 from gateway.app import models, schemas
+from gateway.app.adapters.repo_sql import SQLAlchemyTaskRepository
+from gateway.ports.repository import ITaskRepository
 from gateway.app.services.steps_v1 import (
     run_dub_step,
     run_pack_step,
     run_parse_step,
     run_subtitles_step,
+    use_step_session,
 )
-from gateway.app.providers.registry import get_provider, resolve_tool_providers
+from gateway.app.providers.registry import get_cached_tool_handlers, get_cached_tool_providers
 logger = logging.getLogger(__name__)
 
 DEFAULT_MM_LANG = os.getenv("DEFAULT_MM_LANG", "my")
@@ -35,40 +38,113 @@ DEFAULT_MM_VOICE_ID = os.getenv("DEFAULT_MM_VOICE_ID", "mm_female_1")
 
 def get_defaults() -> dict:
     settings = get_settings()
-    tools = resolve_tool_providers(engine, settings).get("tools", {})
+    tools = get_cached_tool_providers(engine, settings).get("tools", {})
     return {tool: config.get("provider") for tool, config in tools.items()}
 
 
+_thread_state = threading.local()
+
+
+def _thread_pipeline_loop() -> asyncio.AbstractEventLoop:
+    """Return this worker thread's long-lived pipeline event loop.
+
+    Each BackgroundTasks worker thread keeps one loop, so pipelines on
+    different threads never share a loop that a blocking step could stall.
+    """
+
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+    return loop
+
+
 def run_pipeline_background(task_id: str):
-    """Entry point for FastAPI BackgroundTasks; manages its own DB session."""
+    """Entry point for FastAPI BackgroundTasks when no pipeline queue is configured.
+
+    Reuses the worker thread's loop so loop setup and the per-loop pooled
+    HTTP client carry over between tasks run on that thread.
+    """
+
+    _thread_pipeline_loop().run_until_complete(run_pipeline_with_session(task_id))
+
+
+async def run_pipeline_with_session(task_id: str):
+    """Run the pipeline with its own DB session and record crashes on the task."""
 
     db = SessionLocal()
     try:
-        asyncio.run(run_pipeline_for_task(task_id, db))
+        # The v1 steps reuse this session instead of opening one each.
+        with use_step_session(db):
+            await run_pipeline_for_task(task_id, db)
     except Exception as exc:
-        task = db.query(models.Task).filter(models.Task.id == task_id).first()
+        task = db.get(models.Task, task_id)
         if task:
             task.status = "error"
             task.last_step = "pipeline"
             task.error_reason = "pipeline_crash"
             task.error_message = str(exc)
-            task.updated_at = datetime.utcnow()
             db.commit()
         logger.exception("Pipeline crashed for task %s", task_id)
     finally:
         db.close()
 
 
-async def run_pipeline_for_task(task_id: str, db: Session):
-    """Execute the V1 pipeline synchronously in sequence for the given task."""
+def _step_handler(handlers: dict, tool: str, provider: str | None):
+    handler = handlers.get(tool)
+    if handler is None:
+        raise KeyError(f"Unknown provider: {tool}:{provider}")
+    return handler
+
 
-    task = db.query(models.Task).filter(models.Task.id == task_id).first()
+async def _prepare_dub(task_id: str, handlers: dict, dub_provider: str | None):
+    """Resolve the dub handler/request and materialize the audio dir."""
+
+    await asyncio.to_thread(audio_dir, task_id)
+    dub_handler = _step_handler(handlers, "dub", dub_provider)
+    dub_req = schemas.DubRequest.construct(
+        task_id=task_id,
+        voice_id=DEFAULT_MM_VOICE_ID,
+        target_lang=DEFAULT_MM_LANG,
+        force=False,
+    )
+    return dub_handler, dub_req
+
+
+def _task_field(task: Any, name: str) -> Any:
+    if isinstance(task, dict):
+        return task.get(name)
+    return getattr(task, name, None)
+
+
+def _as_task_repository(store: Session | ITaskRepository) -> ITaskRepository:
+    if isinstance(store, Session):
+        return SQLAlchemyTaskRepository(store)
+    return store
+
+
+async def run_pipeline_for_task(task_id: str, store: Session | ITaskRepository):
+    """Execute the V1 pipeline synchronously in sequence for the given task.
+
+    ``store`` is any task repository with ``get``/``update``; a plain SQLAlchemy
+    session is wrapped in :class:`SQLAlchemyTaskRepository`.
+    """
+
+    repo = _as_task_repository(store)
+    task = repo.get(task_id)
     if not task:
         logger.error("Task %s not found, abort pipeline", task_id)
         return
 
+    last_step = _task_field(task, "last_step")
+    # Read what the run needs before the first write: ORM rows expire on commit.
+    platform = _task_field(task, "platform")
+    source_url = _task_field(task, "source_url")
     try:
-        tool_cfg = resolve_tool_providers(engine, get_settings()).get("tools", {})
+        settings = get_settings()
+        tool_cfg = get_cached_tool_providers(engine, settings).get("tools", {})
+        # Resolved with the provider config and cleared with it on admin updates.
+        handlers = get_cached_tool_handlers(engine, settings)
         defaults = {
             key: (value.get("provider") if isinstance(value, dict) else None)
             for key, value in tool_cfg.items()
@@ -90,26 +166,32 @@ async def run_pipeline_for_task(task_id: str, db: Session):
             "Starting pipeline for task %s",
             task_id,
         )
-        logger.info(
-            "Pipeline context task=%s category=%s content_lang=%s ui_lang=%s video_type=%s face_swap_enabled=%s",
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Pipeline context task=%s category=%s content_lang=%s ui_lang=%s video_type=%s face_swap_enabled=%s",
+                task_id,
+                _task_field(task, "category_key"),
+                _task_field(task, "content_lang"),
+                _task_field(task, "ui_lang"),
+                _task_field(task, "video_type"),
+                _task_field(task, "face_swap_enabled"),
+            )
+        last_step = None
+        repo.update(
             task_id,
-            getattr(task, "category_key", None),
-            getattr(task, "content_lang", None),
-            getattr(task, "ui_lang", None),
-            getattr(task, "video_type", None),
-            getattr(task, "face_swap_enabled", None),
+            {
+                "status": "processing",
+                "last_step": None,
+                "error_message": None,
+                "error_reason": None,
+            },
         )
-        task.status = "processing"
-        task.last_step = None
-        task.error_message = None
-        task.error_reason = None
-        db.commit()
 
         async def _run_step(name: str, coro):
+            nonlocal last_step
             try:
                 result = await coro
-                task.last_step = name
-                db.commit()
+                last_step = name
                 return True, result
             except HTTPException as exc:
                 logger.exception("%s step failed for task %s: %s", name, task_id, exc)
@@ -118,143 +200,135 @@ async def run_pipeline_for_task(task_id: str, db: Session):
                 logger.exception("%s step failed for task %s", name, task_id)
                 return False, str(exc)
 
+        def _fail(step_name: str, reason) -> None:
+            nonlocal last_step
+            last_step = step_name
+            repo.update(
+                task_id,
+                {
+                    "status": "error",
+                    "last_step": step_name,
+                    "error_message": str(reason),
+                    "error_reason": str(reason),
+                },
+            )
+
         def _disabled_step(step_name: str) -> bool:
             if enabled.get(step_name, True):
                 return False
-            task.status = "error"
-            task.last_step = step_name
-            task.error_message = f"Tool disabled: {step_name}"
-            task.error_reason = f"Tool disabled: {step_name}"
-            task.updated_at = datetime.utcnow()
-            db.commit()
+            _fail(step_name, f"Tool disabled: {step_name}")
             return True
 
         # Parse
         if _disabled_step("parse"):
             return
-        parse_provider = defaults.get("parse")
-        parse_handler = get_provider("parse", parse_provider)
+        parse_handler = _step_handler(handlers, "parse", defaults.get("parse"))
+        # ParseRequest stays validated: its validators extract the URL from
+        # the stored share text. The other requests use trusted constants.
         parse_req = schemas.ParseRequest(
-            task_id=task.id,
-            platform=task.platform,
-            link=task.source_url,
+            task_id=task_id,
+            platform=platform,
+            link=source_url,
         )
         ok, parse_res = await _run_step("parse", parse_handler(parse_req))
         if not ok:
-            task.status = "error"
-            task.last_step = "parse"
-            task.error_message = str(parse_res)
-            task.error_reason = str(parse_res)
-            task.updated_at = datetime.utcnow()
-            db.commit()
+            _fail("parse", parse_res)
             return
 
-        raw_file = raw_path(task.id)
-        if raw_file.exists():
-            task.raw_path = relative_to_task_workspace(raw_file, task.id)
-        if isinstance(parse_res, dict):
-            duration_sec = parse_res.get("duration_sec")
-        else:
-            duration_sec = getattr(parse_res, "duration_sec", None)
-        if duration_sec:
-            task.duration_sec = int(duration_sec)
-        db.commit()
+        parse_out = schemas.StepResult.from_result(parse_res)
+        parse_fields = {"last_step": "parse"}
+        if parse_out.raw_path:
+            parse_fields["raw_path"] = parse_out.raw_path
+        elif parse_out.raw_exists is None:
+            # Providers that do not report the raw file: fall back to a stat.
+            if "raw/raw.mp4" in workspace.snapshot("raw"):
+                parse_fields["raw_path"] = relative_to_task_workspace(workspace.raw, task_id)
+        if parse_out.duration_sec:
+            parse_fields["duration_sec"] = int(parse_out.duration_sec)
+        repo.update(task_id, parse_fields)
 
         # Subtitles
         if _disabled_step("subtitles"):
             return
-        subtitles_provider = defaults.get("subtitles")
-        subtitles_handler = get_provider("subtitles", subtitles_provider)
-        subs_req = schemas.SubtitlesRequest(
-            task_id=task.id,
+        subtitles_handler = _step_handler(handlers, "subtitles", defaults.get("subtitles"))
+        subs_req = schemas.SubtitlesRequest.construct(
+            task_id=task_id,
             target_lang=DEFAULT_MM_LANG,
             force=False,
             translate=True,
             with_scenes=True,
         )
-        ok, subs_res = await _run_step("subtitles", subtitles_handler(subs_req))
+        # Prepare dub inputs while the subtitles step waits on ASR/LLM calls.
+        dub_prep = asyncio.create_task(_prepare_dub(task_id, handlers, defaults.get("dub")))
+        try:
+            ok, subs_res = await _run_step("subtitles", subtitles_handler(subs_req))
+        except BaseException:
+            dub_prep.cancel()
+            raise
         if not ok:
-            task.status = "error"
-            task.last_step = "subtitles"
-            task.error_message = str(subs_res)
-            task.error_reason = str(subs_res)
-            task.updated_at = datetime.utcnow()
-            db.commit()
+            dub_prep.cancel()
+            _fail("subtitles", subs_res)
             return
+        repo.update(task_id, {"last_step": "subtitles"})
 
         # Dub
         if _disabled_step("dub"):
+            dub_prep.cancel()
             return
-        dub_provider = defaults.get("dub")
-        dub_handler = get_provider("dub", dub_provider)
-        dub_req = schemas.DubRequest(
-            task_id=task.id,
-            voice_id=DEFAULT_MM_VOICE_ID,
-            target_lang=DEFAULT_MM_LANG,
-            force=False,
-        )
+        dub_handler, dub_req = await dub_prep
         ok, dub_res = await _run_step("dub", dub_handler(dub_req))
         if not ok:
-            task.status = "error"
-            task.last_step = "dub"
-            task.error_message = str(dub_res)
-            task.error_reason = str(dub_res)
-            task.updated_at = datetime.utcnow()
-            db.commit()
+            _fail("dub", dub_res)
             return
 
-        if workspace.mm_audio_exists():
-            task.mm_audio_path = relative_to_task_workspace(
-                workspace.mm_audio_path, task.id
-            )
-        elif isinstance(dub_res, dict):
-            audio_path_val = dub_res.get("audio_path") or dub_res.get("path")
-            if audio_path_val:
-                task.mm_audio_path = str(audio_path_val)
-        db.commit()
+        dub_out = schemas.StepResult.from_result(dub_res)
+        mm_audio_path = dub_out.audio_task_path
+        if not mm_audio_path:
+            audio_file = workspace.mm_audio_path_in(workspace.snapshot("audio"))
+            if audio_file is not None:
+                mm_audio_path = relative_to_task_workspace(audio_file, task_id)
+            elif dub_out.audio_path:
+                mm_audio_path = dub_out.audio_path
+        dub_fields = {"last_step": "dub"}
+        if mm_audio_path:
+            dub_fields["mm_audio_path"] = mm_audio_path
+        repo.update(task_id, dub_fields)
 
         # Pack
         if _disabled_step("pack"):
             return
-        pack_provider = defaults.get("pack")
-        if pack_provider == "youcut":
-            pack_provider = "capcut"
-        pack_handler = get_provider("pack", pack_provider)
-        pack_req = schemas.PackRequest(task_id=task.id)
+        pack_handler = _step_handler(handlers, "pack", defaults.get("pack"))
+        pack_req = schemas.PackRequest.construct(task_id=task_id)
         ok, pack_res = await _run_step("pack", pack_handler(pack_req))
         if not ok:
-            task.status = "error"
-            task.last_step = "pack"
-            task.error_message = str(pack_res)
-            task.error_reason = str(pack_res)
-            task.updated_at = datetime.utcnow()
-            db.commit()
+            _fail("pack", pack_res)
             return
 
-        pack_key = None
-        if isinstance(pack_res, dict):
-            pack_key = (
-                pack_res.get("pack_key")
-                or pack_res.get("zip_key")
-                or pack_res.get("pack_path")
-            )
+        done_fields = {
+            "status": "ready",
+            "last_step": "pack",
+            "error_message": None,
+            "error_reason": None,
+        }
+        pack_key = schemas.StepResult.from_result(pack_res).pack_key
         if pack_key:
-            task.pack_key = str(pack_key)
-            task.pack_type = "capcut_v18"
-            task.pack_status = "ready"
-
-        task.status = "ready"
-        task.last_step = "pack"
-        task.error_message = None
-        task.error_reason = None
-        task.updated_at = datetime.utcnow()
-        db.commit()
+            done_fields.update(
+                {
+                    "pack_key": pack_key,
+                    "pack_type": "capcut_v18",
+                    "pack_status": "ready",
+                }
+            )
+        repo.update(task_id, done_fields)
         logger.info("Pipeline finished for task %s", task_id)
     except Exception as exc:  # pragma: no cover - defensive
-        task.status = "error"
-        task.last_step = task.last_step or "pipeline"
-        task.error_message = str(exc)
-        task.error_reason = str(exc)
-        task.updated_at = datetime.utcnow()
-        db.commit()
+        repo.update(
+            task_id,
+            {
+                "status": "error",
+                "last_step": last_step or "pipeline",
+                "error_message": str(exc),
+                "error_reason": str(exc),
+            },
+        )
         logger.exception("Pipeline crashed for task %s", task_id)
@@ -6,7 +6,6 @@ import asyncio
 import os
 import logging
 import re
-import shutil
 import subprocess
 import time
 import wave
@@ -16,7 +15,7 @@ from pathlib import Path
 from fastapi import HTTPException
 
 from gateway.app.config import get_settings
-from gateway.app.core.subtitle_utils import preview_lines, segments_to_srt
+from gateway.app.core.subtitle_utils import preview_lines, segments_to_srt, srt_to_txt
 from gateway.app.core.workspace import (
     Workspace,
     audio_wav_path,
@@ -29,12 +28,13 @@ from gateway.app.providers.gemini_subtitles import (
 )
 from gateway.app.providers.whisper_singleton import get_whisper_model
 from gateway.app.services import subtitles_openai
+from gateway.app.utils.binaries import find_binary
 
 logger = logging.getLogger(__name__)
 
 
-_SRT_TIME_RE = re.compile(
-    r"\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}"
+_SRT_TIME_PARTS_RE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{2})[,\.](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[,\.](\d{3})"
 )
 
 
@@ -48,6 +48,13 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _wav_duration_seconds(wav_path: Path) -> float | None:
     try:
         with wave.open(str(wav_path), "rb") as wf:
@@ -77,27 +84,8 @@ def _compute_asr_timeout_sec(audio_sec: float | None) -> int:
     return max(min_sec, min(dynamic, max_sec))
 
 
-def _srt_to_txt(srt_text: str) -> str:
-    blocks = [b for b in srt_text.split("\n\n") if b.strip()]
-    lines_out: list[str] = []
-    for block in blocks:
-        text_lines: list[str] = []
-        for line in block.splitlines():
-            s = line.strip()
-            if not s:
-                continue
-            if s.isdigit():
-                continue
-            if "-->" in s or _SRT_TIME_RE.search(s):
-                continue
-            text_lines.append(s)
-        if text_lines:
-            lines_out.append(" ".join(text_lines))
-    return "\n".join(lines_out).strip() + ("\n" if lines_out else "")
-
-
 def _write_txt_from_srt(target_path, srt_text: str) -> None:
-    target_path.write_text(_srt_to_txt(srt_text), encoding="utf-8")
+    target_path.write_text(srt_to_txt(srt_text), encoding="utf-8")
 
 
 def build_preview(text: str | None) -> list[str]:
@@ -107,7 +95,7 @@ def build_preview(text: str | None) -> list[str]:
 
 
 def _ffmpeg_path() -> str:
-    ffmpeg = shutil.which("ffmpeg")
+    ffmpeg = find_binary("ffmpeg")
     if not ffmpeg:
         raise RuntimeError("ffmpeg not found in PATH")
     return ffmpeg
@@ -116,8 +104,14 @@ def _ffmpeg_path() -> str:
 def _extract_audio(video_path: Path, wav_path: Path, timeout_sec: int | None = None) -> None:
     ffmpeg = _ffmpeg_path()
     wav_path.parent.mkdir(parents=True, exist_ok=True)
+    # Errors-only log: the captured stderr then holds the failure, not a
+    # progress line per frame of a long video.
     cmd = [
         ffmpeg,
+        "-hide_banner",
+        "-nostats",
+        "-loglevel",
+        "error",
         "-y",
         "-i",
         str(video_path),
@@ -133,7 +127,8 @@ def _extract_audio(video_path: Path, wav_path: Path, timeout_sec: int | None = N
     try:
         p = subprocess.run(
             cmd,
-            stdout=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
             timeout=timeout_sec,
@@ -149,9 +144,22 @@ def _transcribe_with_faster_whisper(
     language_hint: str | None = None,
 ) -> tuple[list[dict], str | None]:
     model = get_whisper_model()
-    kwargs = {}
-    if language_hint:
-        kwargs["language"] = language_hint
+    # Greedy decoding with VAD: skipping silence and language detection is
+    # where most CPU time goes on short clips. Env knobs restore the defaults.
+    kwargs = {
+        "beam_size": max(1, _env_int("WHISPER_BEAM_SIZE", 1)),
+        "condition_on_previous_text": _env_flag("WHISPER_CONDITION_ON_PREVIOUS", False),
+        # Only segment timings are consumed downstream.
+        "word_timestamps": False,
+    }
+    language = language_hint or (os.getenv("WHISPER_LANGUAGE") or "").strip() or None
+    if language:
+        kwargs["language"] = language
+    if _env_flag("WHISPER_VAD_FILTER", True):
+        kwargs["vad_filter"] = True
+        kwargs["vad_parameters"] = {
+            "min_silence_duration_ms": _env_int("WHISPER_VAD_MIN_SILENCE_MS", 500),
+        }
     segments_iter, info = model.transcribe(str(audio_path), **kwargs)
     segments = []
     for idx, seg in enumerate(segments_iter, start=1):
@@ -169,37 +177,88 @@ def _transcribe_with_faster_whisper(
 
 
 def _parse_srt_to_segments(srt_text: str) -> list[dict]:
-    blocks = [b for b in (srt_text or "").split("\n\n") if b.strip()]
-    segments = []
-    for block in blocks:
-        lines = [l for l in block.splitlines() if l.strip()]
-        if len(lines) < 2:
-            continue
-        time_line = lines[1] if lines[0].strip().isdigit() else lines[0]
-        match = _SRT_TIME_RE.search(time_line)
-        if not match:
-            continue
-        start, end = time_line.split("-->")
-        start = start.strip()
-        end = end.strip()
-        start_sec = _parse_srt_time(start)
-        end_sec = _parse_srt_time(end)
-        text_lines = lines[2:] if lines[0].strip().isdigit() else lines[1:]
-        segments.append(
-            {
-                "index": len(segments) + 1,
-                "start": start_sec,
-                "end": end_sec,
-                "origin": "\n".join(text_lines),
-            }
-        )
+    """Single pass over the lines: a blank line closes the current block."""
+
+    segments: list[dict] = []
+    block: list[str] = []
+    for line in (srt_text or "").splitlines():
+        if line.strip():
+            block.append(line)
+        elif block:
+            _append_srt_block(segments, block)
+            block = []
+    if block:
+        _append_srt_block(segments, block)
     return segments
 
 
-def _parse_srt_time(value: str) -> float:
-    h, m, rest = value.replace(",", ".").split(":")
-    s, ms = rest.split(".")
-    return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
+def _append_srt_block(segments: list[dict], lines: list[str]) -> None:
+    if len(lines) < 2:
+        return
+    has_index = lines[0].strip().isdigit()
+    times = _srt_time_line_seconds(lines[1] if has_index else lines[0])
+    if times is None:
+        return
+    segments.append(
+        {
+            "index": len(segments) + 1,
+            "start": times[0],
+            "end": times[1],
+            "origin": "\n".join(lines[2:] if has_index else lines[1:]),
+        }
+    )
+
+
+def _fast_srt_time_ms(line: str, off: int) -> int:
+    """Read ``HH:MM:SS,mmm`` at ``off`` by fixed offsets (caller validated)."""
+
+    o = ord
+    h = (o(line[off]) - 48) * 10 + o(line[off + 1]) - 48
+    m = (o(line[off + 3]) - 48) * 10 + o(line[off + 4]) - 48
+    sec = (o(line[off + 6]) - 48) * 10 + o(line[off + 7]) - 48
+    ms = (o(line[off + 9]) - 48) * 100 + (o(line[off + 10]) - 48) * 10 + o(line[off + 11]) - 48
+    return ((h * 60 + m) * 60 + sec) * 1000 + ms
+
+
+def _is_canonical_srt_time_line(line: str) -> bool:
+    # "HH:MM:SS,mmm --> HH:MM:SS,mmm" exactly at offsets 0 and 17.
+    if len(line) < 29 or line[2] != ":" or line[12:17] != " --> ":
+        return False
+    digits = (
+        line[0:2] + line[3:5] + line[6:8] + line[9:12]
+        + line[17:19] + line[20:22] + line[23:25] + line[26:29]
+    )
+    return (
+        line[5] == ":"
+        and line[8] in ",."
+        and line[19] == ":"
+        and line[22] == ":"
+        and line[25] in ",."
+        and digits.isascii()
+        and digits.isdigit()
+    )
+
+
+def _srt_time_line_seconds(line: str) -> tuple[float, float] | None:
+    if _is_canonical_srt_time_line(line):
+        return _fast_srt_time_ms(line, 0) / 1000.0, _fast_srt_time_ms(line, 17) / 1000.0
+    match = _SRT_TIME_PARTS_RE.search(line)
+    if not match:
+        return None
+    return _srt_match_to_seconds(match)
+
+
+def _srt_match_to_seconds(match: re.Match) -> tuple[float, float]:
+    """Convert a ``_SRT_TIME_PARTS_RE`` match into (start, end) seconds.
+
+    Both timestamps are folded to integer milliseconds in one pass instead of
+    splitting and re-parsing each side of the ``-->`` separately.
+    """
+
+    sh, sm, ss, sms, eh, em, es, ems = map(int, match.groups())
+    start_ms = ((sh * 60 + sm) * 60 + ss) * 1000 + sms
+    end_ms = ((eh * 60 + em) * 60 + es) * 1000 + ems
+    return start_ms / 1000.0, end_ms / 1000.0
 
 
 async def generate_subtitles(
@@ -256,7 +315,15 @@ async def generate_subtitles(
 
             segments: list[dict] = []
             detected_lang = None
-            if workspace.raw_video_exists():
+            cached_origin_srt = None
+            if not force and _env_flag("SUBTITLES_SKIP_TRANSCRIBE", False):
+                cached_origin_srt = workspace.read_origin_srt_text()
+            if cached_origin_srt:
+                # A previous run already produced timed origin segments; reuse
+                # them instead of extracting audio and running ASR again.
+                segments = _parse_srt_to_segments(cached_origin_srt)
+                log_stage("SUB2_ASR_SKIPPED", segments_count=len(segments))
+            elif workspace.raw_video_exists():
                 wav_path = audio_wav_path(task_id)
                 raw_path = workspace.raw_video_path
                 raw_size = raw_path.stat().st_size if raw_path.exists() else None
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+# Media is already compressed (or too cheap to be worth deflating); storing
+# it keeps zip time bound by I/O. Text entries still deflate.
+STORED_SUFFIXES = {".mp4", ".mp3", ".m4a", ".aac", ".flac", ".webm", ".wav", ".zip"}
+
+# zipfile copies members in 8 KiB pieces and writes through an unbuffered
+# path by default; large buffers on both sides cut syscalls on big packs.
+ZIP_WRITE_BUFFER = 4 * 1024 * 1024
+ZIP_COPY_CHUNK = 1024 * 1024
+
+
+def zip_compress_type(path: str | Path) -> int:
+    suffix = os.path.splitext(path)[1].lower()
+    return ZIP_STORED if suffix in STORED_SUFFIXES else ZIP_DEFLATED
+
+
+def walk_files(root: str | Path) -> Iterator[tuple[str, str]]:
+    """Yield ``(path, posix_relpath)`` for regular files under ``root``.
+
+    ``os.scandir`` entries carry their file type, so the walk costs no extra
+    stat per entry; symlinks are not followed. Order is stable (by name).
+    """
+
+    stack = [("", os.fspath(root))]
+    while stack:
+        rel_dir, directory = stack.pop()
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            rel = f"{rel_dir}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((f"{rel}/", entry.path))
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path, rel
+
+
+@contextmanager
+def open_media_zip(zip_path: str | Path) -> Iterator[ZipFile]:
+    """Open a zip for writing through a 4 MiB buffered file handle.
+
+    Text entries use fast deflate; ``zip_tree`` stores media entries. The
+    handle must stay a seekable file: on an unseekable stream zipfile gives
+    every entry a data descriptor, which ``java.util.zip.ZipInputStream``
+    (Android CapCut/YouCut) rejects on STORED entries.
+    """
+
+    with open(zip_path, "wb", buffering=ZIP_WRITE_BUFFER) as handle, ZipFile(
+        handle,
+        "w",
+        compression=ZIP_DEFLATED,
+        compresslevel=1,
+        allowZip64=True,
+        strict_timestamps=False,
+    ) as zf:
+        yield zf
+
+
+def zip_write_file(zf: ZipFile, file_path: str | Path, arcname: str) -> None:
+    """``ZipFile.write`` with per-suffix compression and 1 MiB copy chunks."""
+
+    info = ZipInfo.from_file(file_path, arcname, strict_timestamps=False)
+    info.compress_type = zip_compress_type(file_path)
+    # ZipFile.write sets the entry's level; from_file leaves it unset. The
+    # slot is public as compress_level from Python 3.13.
+    if hasattr(info, "compress_level"):
+        info.compress_level = zf.compresslevel
+    else:
+        info._compresslevel = zf.compresslevel
+    with open(file_path, "rb") as src, zf.open(info, "w") as dest:
+        shutil.copyfileobj(src, dest, ZIP_COPY_CHUNK)
+
+
+def zip_tree(zf: ZipFile, root: str | Path, arc_prefix: str) -> None:
+    """Add every file under ``root`` as ``{arc_prefix}/{relpath}``."""
+
+    for file_path, rel in walk_files(root):
+        zip_write_file(zf, file_path, f"{arc_prefix}/{rel}")
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import shutil
+import threading
+
+_found: dict[str, str] = {}
+_found_lock = threading.Lock()
+
+
+def find_binary(name: str) -> str | None:
+    """``shutil.which`` with the hits memoized for the process.
+
+    Misses are not cached, so installing ffmpeg later still gets picked up.
+    """
+
+    path = _found.get(name)
+    if path:
+        return path
+    path = shutil.which(name)
+    if path:
+        with _found_lock:
+            _found[name] = path
+    return path
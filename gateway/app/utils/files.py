@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+# copy_file_range errors that just mean "not here": fall back to copyfile.
+_COPY_RANGE_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+}
+COPY_RANGE_CHUNK = 1 << 30
+DIGEST_CHUNK = 1024 * 1024
+
+
+def fast_copy(src: str | Path, dst: str | Path) -> None:
+    """Copy file contents only (no metadata), in the kernel where possible.
+
+    ``os.copy_file_range`` lets the filesystem share extents (reflink on
+    btrfs/xfs) or copy without a userspace buffer; when it is unavailable
+    ``shutil.copyfile`` uses sendfile on Linux. Like ``shutil.copyfile``,
+    copying a file onto itself raises :class:`shutil.SameFileError` instead
+    of truncating it.
+    """
+
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(
+                        fsrc.fileno(), fdst.fileno(), min(remaining, COPY_RANGE_CHUNK)
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError as exc:
+            if exc.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+                raise
+    shutil.copyfile(src, dst)
+
+
+def file_digest(path: str | Path) -> str:
+    """Hex blake2b-128 of the whole file, read in 1 MiB chunks."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    buf = bytearray(DIGEST_CHUNK)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as fh:
+        while True:
+            n = fh.readinto(buf)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# 未安装 orjson 时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_pretty(payload: Any) -> bytes:
+    """Serialize ``payload`` as indented UTF-8 JSON bytes.
+
+    orjson encodes straight to bytes; the stdlib fallback produces the same
+    ``indent=2``, non-ASCII-preserving layout.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
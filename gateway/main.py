@@ -4,7 +4,9 @@ from fastapi.responses import HTMLResponse
 from gateway.routes import admin_tools, files, tasks, v1
 from gateway.app.config import create_storage_service, get_settings
 from gateway.app.db import Base, engine, ensure_provider_config_table, ensure_task_extra_columns
+from gateway.app.core.http_client import close_http_client
 from gateway.app.ports.storage_provider import set_storage_service
+from gateway.app.services.pipeline_queue import close_pipeline_queue, create_pipeline_queue
 from gateway.app.web.templates import get_templates
 
 settings = None
@@ -48,6 +50,17 @@ def on_startup() -> None:
     set_storage_service(create_storage_service())
 
 
+@app.on_event("startup")
+async def on_startup_pipeline_queue() -> None:
+    app.state.pipeline_queue = await create_pipeline_queue()
+
+
+@app.on_event("shutdown")
+async def on_shutdown_pipeline_queue() -> None:
+    await close_pipeline_queue(getattr(app.state, "pipeline_queue", None))
+    await close_http_client()
+
+
 app.include_router(v1.router, prefix="/v1", tags=["v1"])
 app.include_router(tasks.router, prefix="/api", tags=["tasks"])
 app.include_router(tasks.pages_router)
@@ -6,7 +6,11 @@ from pydantic import BaseModel
 
 from gateway.app.config import get_settings
 from gateway.app.db import engine, set_provider_config_map
-from gateway.app.providers.registry import AVAILABLE_PROVIDERS, resolve_tool_providers
+from gateway.app.providers.registry import (
+    AVAILABLE_PROVIDERS,
+    clear_tool_providers_cache,
+    resolve_tool_providers,
+)
 from gateway.app.web.templates import get_templates
 
 router = APIRouter()
@@ -45,6 +49,7 @@ def update_tools(payload: ToolsPayload):
         updates[f"{tool}_enabled"] = "true" if entry.enabled else "false"
 
     set_provider_config_map(engine, updates)
+    clear_tool_providers_cache()
     settings = get_settings()
     return resolve_tool_providers(engine, settings)
 
@@ -7,6 +7,7 @@ from typing import Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -22,7 +23,7 @@ from gateway.app.core.workspace import (
     translated_srt_path,
     workspace_root,
 )
-from gateway.app.db import get_db
+from gateway.app.db import SessionLocal, get_db
 from gateway.app.web.templates import get_templates
 from gateway.app.schemas import (
     PackRequest,
@@ -35,6 +36,7 @@ from gateway.app.schemas import (
 )
 from gateway.app.services.artifact_storage import object_exists
 from gateway.app.services.scene_split import enqueue_scenes_build
+from gateway.app.services.pipeline_queue import enqueue_pipeline
 from gateway.app.services.publish_service import publish_task_pack, resolve_download_url
 from gateway.app.steps.pipeline_v1 import run_pipeline_background
 from gateway.app.services.steps_v1 import (
@@ -246,9 +248,18 @@ async def task_workbench_mobile(
     return response
 
 
+def _insert_task(db: Session, db_task: models.Task) -> None:
+    db.add(db_task)
+    db.commit()
+    db.refresh(db_task)
+
+
 @router.post("", response_model=TaskDetail)
-def create_task(
-    payload: TaskCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+async def create_task(
+    payload: TaskCreate,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
 ):
     """
     Create a Task record and kick off the V1 pipeline asynchronously.
@@ -275,11 +286,12 @@ def create_task(
         last_step=None,
         error_message=None,
     )
-    db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    # The handler is async only to await the queue; keep DB I/O off the loop.
+    await run_in_threadpool(_insert_task, db, db_task)
 
-    background_tasks.add_task(run_pipeline_background, db_task.id)
+    queue = getattr(request.app.state, "pipeline_queue", None)
+    if not await enqueue_pipeline(queue, db_task.id):
+        background_tasks.add_task(run_pipeline_background, db_task.id)
 
     return TaskDetail(
         task_id=db_task.id,
@@ -468,13 +480,12 @@ def build_scenes(
         raise HTTPException(status_code=404, detail="Task not found")
 
     def _update(task_id: str, fields: dict) -> None:
-        t = db.query(models.Task).filter(models.Task.id == task_id).first()
-        if not t:
-            return
-        for key, value in fields.items():
-            if hasattr(t, key):
-                setattr(t, key, value)
-        db.commit()
+        # Runs from the background build after the request session is gone:
+        # a short-lived session and a single UPDATE, no row load.
+        from gateway.app.adapters.repo_sql import update_task_fields
+
+        with SessionLocal() as session:
+            update_task_fields(session, task_id, fields)
 
     return enqueue_scenes_build(
         task_id,
@@ -58,6 +58,23 @@ async def _run_dub_background(req: DubRequest) -> None:
         )
 
 
+async def _run_pack_background(req: PackRequest) -> None:
+    try:
+        await run_pack_step(req)
+    except HTTPException as exc:
+        _update_task(req.task_id, pack_status="error", pack_error=f"{exc.status_code}: {exc.detail}")
+        logger.exception(
+            "PACK_FAIL",
+            extra={"task_id": req.task_id, "step": "pack", "phase": "exception"},
+        )
+    except Exception as exc:
+        _update_task(req.task_id, pack_status="error", pack_error=str(exc))
+        logger.exception(
+            "PACK_FAIL",
+            extra={"task_id": req.task_id, "step": "pack", "phase": "exception"},
+        )
+
+
 @router.post("/parse")
 async def parse(request: ParseRequest):
     return await run_parse_step(request)
@@ -83,4 +100,15 @@ async def dub(request: DubRequest):
 
 @router.post("/pack")
 async def pack(request: PackRequest):
+    if _steps_async_enabled():
+        _update_task(request.task_id, pack_status="running", pack_error=None)
+        asyncio.create_task(_run_pack_background(request))
+        return JSONResponse(
+            status_code=202,
+            content={
+                "queued": True,
+                "task_id": request.task_id,
+                "status_url": f"/v1/tasks/{request.task_id}/pack/status",
+            },
+        )
     return await run_pack_step(request)
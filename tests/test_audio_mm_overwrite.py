@@ -9,6 +9,7 @@ from sqlalchemy import text
 
 from gateway.app.core import workspace as workspace_module
 from gateway.app.db import SessionLocal, ensure_task_extra_columns, engine
+from gateway.app.ports.storage import IStorageService
 from gateway.app.schemas import DubRequest, PackRequest
 from gateway.app.services import steps_v1
 
@@ -183,27 +184,68 @@ def test_pack_step_downloads_mm_audio_key(monkeypatch, tmp_path: Path) -> None:
     finally:
         db.close()
 
-    class DummyStorage:
+    class DummyStorage(IStorageService):
         def __init__(self):
             self.download_key = None
+            self.uploaded = None
 
         def download_file(self, key, local_path):
             self.download_key = key
             Path(local_path).write_bytes(b"audio")
 
-        def upload_file(self, *_args, **_kwargs):
-            return "packs/demo/capcut_pack.zip"
+        def upload_file(self, file_path, key, content_type=None):
+            self.uploaded = (key, Path(file_path).read_bytes())
+            return key
+
+        def exists(self, key):
+            return True
 
         def generate_presigned_url(self, *_args, **_kwargs):
             return "https://example.invalid/pack.zip"
 
     dummy = DummyStorage()
     monkeypatch.setattr(steps_v1, "get_storage_service", lambda: dummy)
+    sessions = []
+    real_session_local = steps_v1.SessionLocal
+
+    def counting_session_local():
+        sessions.append(1)
+        return real_session_local()
+
+    monkeypatch.setattr(steps_v1, "SessionLocal", counting_session_local)
 
     asyncio.run(steps_v1.run_pack_step(PackRequest(task_id=task_id)))
 
+    assert len(sessions) == 1
+    # The local deliver zip is what gets uploaded.
+    assert dummy.uploaded[0].endswith("capcut_pack.zip")
+    assert dummy.uploaded[1] == steps_v1.deliver_pack_zip_path(task_id).read_bytes()
+
     assert dummy.download_key == f"deliver/tasks/{task_id}/audio_mm.mp3"
 
+    from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+    prefix = f"deliver/packs/{task_id}"
+    with ZipFile(steps_v1.deliver_pack_zip_path(task_id)) as zf:
+        assert sorted(zf.namelist()) == sorted(
+            [
+                f"{prefix}/raw/raw.mp4",
+                f"{prefix}/audio/voice_my.mp3",
+                f"{prefix}/subs/mm.srt",
+                f"{prefix}/subs/mm.txt",
+                f"{prefix}/scenes/.keep",
+                f"{prefix}/manifest.json",
+                f"{prefix}/README.md",
+            ]
+        )
+        assert zf.getinfo(f"{prefix}/raw/raw.mp4").compress_type == ZIP_STORED
+        assert zf.getinfo(f"{prefix}/audio/voice_my.mp3").compress_type == ZIP_STORED
+        assert zf.getinfo(f"{prefix}/manifest.json").compress_type == ZIP_DEFLATED
+        # java.util.zip.ZipInputStream rejects STORED entries with a data
+        # descriptor (flag bit 3).
+        for name in (f"{prefix}/raw/raw.mp4", f"{prefix}/audio/voice_my.mp3"):
+            assert zf.getinfo(name).flag_bits & 0x8 == 0
+
 
 def test_run_dub_step_overwrites_mm_txt_when_mm_edited_exists(
     monkeypatch, tmp_path: Path
@@ -246,3 +288,44 @@ def test_run_dub_step_overwrites_mm_txt_when_mm_edited_exists(
 
     assert ws.mm_txt_path.read_text(encoding="utf-8") == "edited text"
     assert ws.mm_srt_path.read_text(encoding="utf-8").strip().endswith("original")
+
+
+def test_step_session_reuses_outer_session(monkeypatch) -> None:
+    def fail_session_local():
+        raise AssertionError("SessionLocal should not be opened")
+
+    db = SessionLocal()
+    try:
+        db.info["task_refs"] = {"stale": object()}
+        monkeypatch.setattr(steps_v1, "SessionLocal", fail_session_local)
+        with steps_v1.use_step_session(db):
+            with steps_v1.step_session() as step_db:
+                assert step_db is db
+        assert "task_refs" not in db.info
+    finally:
+        db.close()
+
+
+
+def test_subtitles_step_marks_running_before_asr(monkeypatch, tmp_path: Path) -> None:
+    from gateway.app.schemas import SubtitlesRequest
+
+    task_id = "demo_subs_running"
+    _ensure_task(task_id)
+    monkeypatch.setattr(workspace_module, "workspace_root", lambda: tmp_path)
+    monkeypatch.setattr(steps_v1, "deliver_dir", lambda: tmp_path / "deliver")
+    updates = []
+
+    async def fake_generate_subtitles(**_kwargs):
+        # Pipeline runs have no caller-side mark: the step must set it.
+        assert updates == [{"subtitles_status": "running", "subtitles_error": None}]
+        return {"ok": True}
+
+    monkeypatch.setattr(steps_v1, "generate_subtitles", fake_generate_subtitles)
+    monkeypatch.setattr(
+        steps_v1, "_update_task", lambda _task_id, db=None, **fields: updates.append(fields)
+    )
+
+    asyncio.run(steps_v1.run_subtitles_step(SubtitlesRequest(task_id=task_id, target_lang="my")))
+
+    assert updates[-1]["subtitles_status"] == "ready"
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_fast_copy_falls_back_when_copy_range_unsupported(tmp_path: Path, monkeypatch) -> None:
+    import errno
+
+    from gateway.app.utils import files
+
+    def no_copy_range(*_args):
+        raise OSError(errno.ENOSYS, "copy_file_range")
+
+    monkeypatch.setattr(files.os, "copy_file_range", no_copy_range, raising=False)
+    src = tmp_path / "raw.mp4"
+    src.write_bytes(b"x" * 5000)
+    dst = tmp_path / "out.mp4"
+
+    files.fast_copy(src, dst)
+
+    assert dst.read_bytes() == b"x" * 5000
+
+
+def test_fast_copy_refuses_to_copy_a_file_onto_itself(tmp_path: Path) -> None:
+    import shutil
+
+    import pytest
+
+    from gateway.app.utils.files import fast_copy
+
+    path = tmp_path / "scenes.zip"
+    path.write_bytes(b"zip")
+
+    with pytest.raises(shutil.SameFileError):
+        fast_copy(path, path)
+    assert path.read_bytes() == b"zip"
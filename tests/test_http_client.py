@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import asyncio
+
+
+def test_http_client_is_shared_per_event_loop() -> None:
+    from gateway.app.core.http_client import close_http_client, get_http_client
+
+    async def _run():
+        first = get_http_client()
+        second = get_http_client()
+        await close_http_client()
+        return first, second
+
+    first, second = asyncio.run(_run())
+    assert first is second
+    assert first.is_closed
+
+    other, _ = asyncio.run(_run())
+    assert other is not first
@@ -29,3 +29,27 @@ def test_generate_youcut_pack_structure(tmp_path: Path) -> None:
         "subtitle": "subs/my.srt",
         "scenes_dir": "scenes/",
     }
+
+
+def test_zip_youcut_pack_stores_media(tmp_path: Path) -> None:
+    import zipfile
+
+    from gateway.app.core.pack_v17_youcut import zip_youcut_pack
+
+    pack_root = generate_youcut_pack("demo_task_002", tmp_path, placeholders=True)
+    zip_path = zip_youcut_pack(pack_root)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+        assert zf.testzip() is None
+    assert set(infos) == {
+        "demo_task_002/README.md",
+        "demo_task_002/manifest.json",
+        "demo_task_002/raw/raw.mp4",
+        "demo_task_002/audio/voice_my.wav",
+        "demo_task_002/subs/my.srt",
+        "demo_task_002/scenes/scene_001.mp4",
+    }
+    assert infos["demo_task_002/raw/raw.mp4"].compress_type == zipfile.ZIP_STORED
+    assert infos["demo_task_002/audio/voice_my.wav"].compress_type == zipfile.ZIP_STORED
+    assert infos["demo_task_002/subs/my.srt"].compress_type == zipfile.ZIP_DEFLATED
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+
+def test_enqueue_pipeline_without_queue_falls_back() -> None:
+    from gateway.app.services.pipeline_queue import enqueue_pipeline
+
+    assert asyncio.run(enqueue_pipeline(None, "task-1")) is False
+
+
+def test_enqueue_pipeline_uses_queue() -> None:
+    from gateway.app.services.pipeline_queue import PIPELINE_JOB_NAME, enqueue_pipeline
+
+    calls = []
+
+    class FakeQueue:
+        async def enqueue_job(self, name, *args, **kwargs):
+            calls.append((name, args))
+            return SimpleNamespace(job_id=kwargs["_job_id"])
+
+    assert asyncio.run(enqueue_pipeline(FakeQueue(), "task-1")) is True
+    assert calls == [(PIPELINE_JOB_NAME, ("task-1",))]
+
+
+def test_enqueue_pipeline_duplicate_job_is_not_run_again() -> None:
+    from gateway.app.services.pipeline_queue import enqueue_pipeline
+
+    class DuplicateQueue:
+        async def enqueue_job(self, *_args, **_kwargs):
+            # ARQ returns None when a job with the same _job_id exists.
+            return None
+
+    assert asyncio.run(enqueue_pipeline(DuplicateQueue(), "task-1")) is True
+
+
+def test_worker_shutdown_closes_http_client() -> None:
+    from gateway.app.core.http_client import get_http_client
+    from gateway.app.services.pipeline_queue import WorkerSettings
+
+    async def _run():
+        client = get_http_client()
+        await WorkerSettings.on_shutdown({})
+        return client
+
+    assert asyncio.run(_run()).is_closed
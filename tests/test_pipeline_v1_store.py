@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+
+class _DictRepo:
+    def __init__(self, task: dict) -> None:
+        self.tasks = {task["id"]: dict(task)}
+
+    def get(self, task_id: str):
+        return self.tasks.get(task_id)
+
+    def update(self, task_id: str, updates: dict):
+        self.tasks[task_id].update(updates)
+        return self.tasks[task_id]
+
+
+def test_pipeline_runs_against_task_repository(monkeypatch, tmp_path: Path) -> None:
+    from gateway.app.core import workspace as workspace_module
+    from gateway.app.steps import pipeline_v1
+
+    monkeypatch.setattr(workspace_module, "workspace_root", lambda: tmp_path)
+    monkeypatch.setattr(pipeline_v1, "get_cached_tool_providers", lambda *_a, **_k: {})
+
+    steps = []
+
+    def fake_handler(tool: str):
+        async def handler(_req):
+            steps.append(tool)
+            if tool == "pack":
+                return {"zip_key": "deliver/packs/demo/capcut_pack.zip"}
+            return {}
+
+        return handler
+
+    handlers = {tool: fake_handler(tool) for tool in ("parse", "subtitles", "dub", "pack")}
+    monkeypatch.setattr(pipeline_v1, "get_cached_tool_handlers", lambda *_a, **_k: handlers)
+
+    repo = _DictRepo({"id": "demo_store", "platform": "douyin", "source_url": "https://v.douyin.com/x"})
+    asyncio.run(pipeline_v1.run_pipeline_for_task("demo_store", repo))
+
+    stored = repo.get("demo_store")
+    assert steps == ["parse", "subtitles", "dub", "pack"]
+    assert stored["status"] == "ready"
+    assert stored["last_step"] == "pack"
+    assert stored["pack_key"] == "deliver/packs/demo/capcut_pack.zip"
+
+
+def test_workspace_snapshot_resolves_audio(monkeypatch, tmp_path: Path) -> None:
+    from gateway.app.core import workspace as workspace_module
+
+    monkeypatch.setattr(workspace_module, "workspace_root", lambda: tmp_path)
+    ws = workspace_module.Workspace("demo_snapshot")
+    ws.mm_audio_mp3_path.write_bytes(b"mp3")
+
+    present = ws.snapshot("raw", "audio", "missing")
+    assert "audio/demo_snapshot_mm.mp3" in present
+    assert ws.mm_audio_path_in(present) == ws.mm_audio_mp3_path
+    assert ws.mm_audio_path_in(set()) is None
+
+
+def test_background_pipelines_get_one_loop_per_thread() -> None:
+    import threading
+
+    from gateway.app.steps import pipeline_v1
+
+    loops = []
+
+    def worker() -> None:
+        first = pipeline_v1._thread_pipeline_loop()
+        assert pipeline_v1._thread_pipeline_loop() is first
+        loops.append(first)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loops[0] is not loops[1]
+    for loop in loops:
+        loop.close()
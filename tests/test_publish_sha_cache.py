@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+
+def test_pack_sha256_reused_until_zip_changes(monkeypatch, tmp_path: Path) -> None:
+    import gateway.app.db  # noqa: F401  (import order: db before models)
+    from gateway.app.services import publish_service
+
+    zip_path = tmp_path / "capcut_pack.zip"
+    zip_path.write_bytes(b"pack-v1")
+    task = SimpleNamespace(pack_sha256=None, pack_sha256_stamp=None)
+
+    calls = {"count": 0}
+    real_sha = publish_service._sha256_file
+
+    def counting_sha(path: Path) -> str:
+        calls["count"] += 1
+        return real_sha(path)
+
+    monkeypatch.setattr(publish_service, "_sha256_file", counting_sha)
+
+    first = publish_service._cached_pack_sha256(task, zip_path)
+    second = publish_service._cached_pack_sha256(task, zip_path)
+    assert first == second
+    assert calls["count"] == 1
+
+    zip_path.write_bytes(b"pack-v2-longer")
+    third = publish_service._cached_pack_sha256(task, zip_path)
+    assert third != first
+    assert calls["count"] == 2
+
+
+def test_r2_publish_uploads_straight_to_digest_key(monkeypatch, tmp_path: Path) -> None:
+    import hashlib
+
+    import gateway.app.db  # noqa: F401  (import order: db before models)
+    from gateway.app.services import publish_service
+
+    zip_path = tmp_path / "capcut_pack.zip"
+    zip_path.write_bytes(b"pack")
+    task = SimpleNamespace(
+        id="t",
+        publish_provider=None,
+        publish_status=None,
+        publish_key=None,
+        pack_sha256=None,
+        pack_sha256_stamp=None,
+    )
+
+    class FakeQuery:
+        def filter(self, *_args):
+            return self
+
+        def first(self):
+            return task
+
+    class FakeDb:
+        def query(self, _model):
+            return FakeQuery()
+
+        def commit(self):
+            pass
+
+    uploads = []
+    monkeypatch.setattr(publish_service, "pack_zip_path", lambda _task_id: zip_path)
+    monkeypatch.setattr(publish_service, "_r2_put_file", lambda path, key: uploads.append((path, key)))
+
+    result = publish_service.publish_task_pack("t", FakeDb(), provider="r2")
+
+    digest = hashlib.sha256(b"pack").hexdigest()
+    assert uploads == [(zip_path, f"published/t/capcut_pack_{digest[:12]}.zip")]
+    assert result["publish_key"] == uploads[0][1]
+    assert task.pack_sha256 == digest
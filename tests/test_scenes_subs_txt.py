@@ -46,3 +46,34 @@ def test_scenes_have_subs_txt(monkeypatch, tmp_path: Path) -> None:
             assert txt.exists(), f"Missing subs.txt for {scene_dir}"
             content = txt.read_text(encoding="utf-8")
             assert "-->" not in content
+
+
+def test_clip_srt_index_matches_linear_scan() -> None:
+    from gateway.app.services import scene_split
+
+    entries = [
+        scene_split.SrtEntry(start=0.0, end=4.0, text="long"),
+        scene_split.SrtEntry(start=1.0, end=2.0, text="short"),
+        scene_split.SrtEntry(start=2.5, end=3.5, text="mid"),
+        scene_split.SrtEntry(start=6.0, end=7.0, text="late"),
+    ]
+    max_ends = scene_split._srt_max_ends(entries)
+    for start, end in ((0.0, 1.5), (2.1, 3.0), (3.9, 6.5), (7.0, 9.0)):
+        assert scene_split._clip_srt_with_text(
+            entries, start, end, max_ends
+        ) == scene_split._clip_srt_with_text(entries, start, end)
+    assert scene_split._srt_max_ends(list(reversed(entries))) is None
+
+
+def test_srt_to_txt_joins_cue_lines() -> None:
+    from gateway.app.core.subtitle_utils import segments_to_srt, srt_to_txt
+
+    srt = segments_to_srt(
+        [
+            {"start": 0, "end": 1, "origin": "hello\nworld"},
+            {"start": 1, "end": 2.5, "origin": "12"},
+            {"start": 3, "end": 4, "origin": "  bye  "},
+        ]
+    )
+    assert srt_to_txt(srt) == "hello world\nbye\n"
+    assert srt_to_txt("") == ""
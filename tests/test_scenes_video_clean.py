@@ -30,3 +30,56 @@ def test_scene_slice_video_is_muted(monkeypatch, tmp_path: Path) -> None:
     assert "-an" in captured["args"]
     assert "-sn" in captured["args"]
     assert "-dn" in captured["args"]
+
+
+def test_scene_slices_are_batched_into_one_ffmpeg_call(monkeypatch, tmp_path: Path) -> None:
+    from gateway.app.services import scene_split
+
+    src = tmp_path / "src.mp4"
+    src.write_bytes(b"fake")
+    jobs = [
+        (tmp_path / f"scene_{i}" / "video.mp4", tmp_path / f"scene_{i}" / "audio.wav", i * 2.0, i * 2.0 + 1.5)
+        for i in range(3)
+    ]
+    for video_dst, _audio_dst, _start, _end in jobs:
+        video_dst.parent.mkdir()
+    calls: list[list[str]] = []
+
+    def fake_run_ffmpeg(args: list[str]) -> None:
+        calls.append(args)
+        for video_dst, audio_dst, _start, _end in jobs:
+            video_dst.write_bytes(b"v")
+            audio_dst.write_bytes(b"a")
+
+    monkeypatch.setattr(scene_split, "_ffmpeg_path", lambda: "ffmpeg")
+    monkeypatch.setattr(scene_split, "_run_ffmpeg", fake_run_ffmpeg)
+
+    assert scene_split._slice_scenes_batched(src, jobs) is True
+    assert len(calls) == 1
+    assert calls[0].count("-i") == 3
+    assert "2:a:0" in calls[0]
+
+
+def test_audioless_source_gets_silence_without_ffmpeg(monkeypatch, tmp_path: Path) -> None:
+    import wave
+
+    from gateway.app.services import scene_split
+
+    src = tmp_path / "src.mp4"
+    src.write_bytes(b"fake")
+    dst = tmp_path / "scene_001" / "audio.wav"
+    dst.parent.mkdir()
+
+    def no_ffmpeg(*_args, **_kwargs):
+        raise AssertionError("ffmpeg should not run for an audioless source")
+
+    monkeypatch.setattr(scene_split, "_source_has_audio", lambda _src: False)
+    monkeypatch.setattr(scene_split, "_ffmpeg_path", no_ffmpeg)
+    monkeypatch.setattr(scene_split, "_run_ffmpeg", no_ffmpeg)
+
+    scene_split._slice_audio(src, dst, 1.0, 3.5)
+
+    with wave.open(str(dst), "rb") as wf:
+        assert wf.getframerate() == 16000
+        assert wf.getnchannels() == 1
+        assert wf.getnframes() == 40000
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 
 class FakeStorage:
@@ -74,9 +74,39 @@ def test_scenes_zip_layout(tmp_path, monkeypatch) -> None:
         assert f"{prefix}scenes/scene_001/subs.srt" in names
         assert f"{prefix}scenes/scene_001/scene.json" in names
 
+        assert zf.getinfo(f"{prefix}scenes/scene_001/video.mp4").compress_type == ZIP_STORED
+        assert zf.getinfo(f"{prefix}scenes/scene_001/subs.srt").compress_type == ZIP_DEFLATED
+
         readme = zf.read(f"{prefix}README.md").decode("utf-8")
         assert "Scenes.zip 使用说明" in readme
 
         manifest = json.loads(zf.read(f"{prefix}scenes_manifest.json").decode("utf-8"))
         assert manifest["task_id"] == task_id
         assert manifest["scenes"][0]["scene_id"] == "scene_001"
+        assert manifest["source"]["raw_video"] == f"tasks/{task_id}/raw/raw.mp4"
+        assert manifest["source"]["subs"] == f"deliver/packs/{task_id}/subs/mm.srt"
+
+
+def test_scene_zip_pipeline_waits_for_all_parts(tmp_path) -> None:
+    from gateway.app.services import scene_split
+
+    scene_dir = tmp_path / "scene_001"
+    scene_dir.mkdir()
+    (scene_dir / "scene.json").write_text("{}", encoding="utf-8")
+    (scene_dir / "video.mp4").write_bytes(b"video")
+
+    zip_path = tmp_path / "out.zip"
+    with ZipFile(zip_path, "w") as zf:
+        pipeline = scene_split._SceneZipPipeline(zf, "pkg/scenes")
+        pipeline.part_done(scene_dir)
+        pipeline.output_done(scene_dir / "video.mp4")
+        (scene_dir / "audio.wav").write_bytes(b"audio")
+        pipeline.output_done(scene_dir / "audio.wav")
+        pipeline.close()
+
+    with ZipFile(zip_path) as zf:
+        assert sorted(zf.namelist()) == [
+            "pkg/scenes/scene_001/audio.wav",
+            "pkg/scenes/scene_001/scene.json",
+            "pkg/scenes/scene_001/video.mp4",
+        ]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_ensure_mp3_audio_copies_mp3_header_without_ffmpeg(tmp_path, monkeypatch) -> None:
+    import gateway.app.db  # noqa: F401
+    from gateway.app.services import steps_v1
+
+    src = tmp_path / "voice.wav"
+    src.write_bytes(b"ID3\x04\x00\x00\x00\x00\x00\x00" + b"\xff\xfb\x90\x00" * 8)
+    dst = tmp_path / "out" / "voice.mp3"
+
+    def no_ffmpeg(_name):
+        raise AssertionError("ffmpeg should not be needed")
+
+    monkeypatch.setattr(steps_v1, "find_binary", no_ffmpeg)
+    assert steps_v1.ensure_mp3_audio(src, dst) == dst
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_detect_audio_kind(tmp_path) -> None:
+    import gateway.app.db  # noqa: F401
+    from gateway.app.services.steps_v1 import detect_audio_kind
+
+    samples = {
+        "frame.bin": (b"\xff\xfb\x90\x00" * 3, "mp3"),
+        "adts.bin": (b"\xff\xf1\x50\x80" * 3, "aac"),
+        "riff.bin": (b"RIFF\x24\x00\x00\x00WAVEfmt ", "wav"),
+        "other.bin": (b"\x00\x00\x00\x18ftypM4A ", "other"),
+    }
+    for name, (data, kind) in samples.items():
+        path = tmp_path / name
+        path.write_bytes(data)
+        assert detect_audio_kind(path) == kind
+
+
+def test_ensure_mp3_audio_reuses_cached_encode(tmp_path, monkeypatch) -> None:
+    import gateway.app.db  # noqa: F401
+    from gateway.app.core import workspace as workspace_module
+    from gateway.app.services import steps_v1
+
+    monkeypatch.setattr(workspace_module, "workspace_root", lambda: tmp_path)
+    src = tmp_path / "voice.wav"
+    src.write_bytes(b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 64)
+    calls = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        Path(cmd[-1]).write_bytes(b"encoded")
+        return subprocess.CompletedProcess(cmd, 0, stderr="")
+
+    monkeypatch.setattr(steps_v1, "find_binary", lambda _name: "ffmpeg")
+    monkeypatch.setattr(steps_v1.subprocess, "run", fake_run)
+
+    first = steps_v1.ensure_mp3_audio(src, tmp_path / "a" / "voice.mp3")
+    second = steps_v1.ensure_mp3_audio(src, tmp_path / "b" / "voice.mp3")
+
+    assert len(calls) == 1
+    assert first.read_bytes() == second.read_bytes() == b"encoded"
+
+
+def test_mp3_cache_evicts_least_recently_used(tmp_path, monkeypatch) -> None:
+    import os
+
+    import gateway.app.db  # noqa: F401
+    from gateway.app.services import steps_v1
+
+    monkeypatch.setattr(steps_v1, "MP3_CACHE_MAX_FILES", 2)
+    cache_dir = tmp_path / "mp3_cache"
+    cache_dir.mkdir()
+    for i, name in enumerate(["old", "mid"]):
+        entry = cache_dir / f"{name}.mp3"
+        entry.write_bytes(b"x")
+        os.utime(entry, (1000 + i, 1000 + i))
+    encoded = tmp_path / "voice.mp3"
+    encoded.write_bytes(b"encoded")
+
+    steps_v1.store_mp3_cache(encoded, cache_dir / "new.mp3")
+
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["mid.mp3", "new.mp3"]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+
+
+def _service(fake):
+    from gateway.app.adapters.storage_r2 import R2StorageService
+
+    service = R2StorageService.__new__(R2StorageService)
+    service.s3_client = fake
+    service.bucket_name = "bucket"
+    return service
+
+
+def test_local_upload_and_download_copy_contents(tmp_path) -> None:
+    from gateway.app.adapters.storage_local import LocalStorageService
+
+    service = LocalStorageService(str(tmp_path / "store"))
+    src = tmp_path / "raw.mp4"
+    src.write_bytes(os.urandom(64 * 1024))
+    service.upload_file(str(src), "raw/t/raw.mp4")
+    out = tmp_path / "work" / "raw.mp4"
+    service.download_file("raw/t/raw.mp4", str(out))
+
+    assert out.read_bytes() == src.read_bytes()
+    assert not os.path.samefile(out, tmp_path / "store" / "raw" / "t" / "raw.mp4")
+
+
+def test_r2_file_transfers_use_multipart_config(tmp_path) -> None:
+    from gateway.app.adapters import storage_r2
+
+    calls = []
+
+    class FakeTransferS3:
+        def upload_file(self, *args, **kwargs):
+            calls.append(kwargs)
+
+        def download_file(self, *args, **kwargs):
+            calls.append(kwargs)
+
+    service = _service(FakeTransferS3())
+    service.upload_file(str(tmp_path / "capcut_pack.zip"), "packs/t/capcut_pack.zip")
+    service.download_file("packs/t/capcut_pack.zip", str(tmp_path / "out.zip"))
+
+    assert calls[0]["ExtraArgs"] == {"ContentType": "application/zip"}
+    assert all(call["Config"] is storage_r2.FILE_TRANSFER_CONFIG for call in calls)
+    assert storage_r2.FILE_TRANSFER_CONFIG.multipart_chunksize == storage_r2.MULTIPART_PART_SIZE
+
+
+def test_local_upload_of_the_stored_file_keeps_it(tmp_path) -> None:
+    from gateway.app.adapters.storage_local import LocalStorageService
+
+    service = LocalStorageService(str(tmp_path))
+    stored = tmp_path / "deliver" / "scenes" / "t" / "scenes.zip"
+    stored.parent.mkdir(parents=True)
+    stored.write_bytes(b"zip")
+
+    service.upload_file(str(stored), "deliver/scenes/t/scenes.zip")
+    service.download_file("deliver/scenes/t/scenes.zip", str(stored))
+
+    assert stored.read_bytes() == b"zip"
@@ -44,3 +44,58 @@ def test_subtitles_fallback_on_gemini_error(tmp_path, monkeypatch) -> None:
     assert workspace.mm_srt_path.exists()
     assert workspace.segments_json.exists()
     assert result["origin_srt"].strip() != ""
+
+
+def test_subtitles_reuses_origin_srt_when_skip_enabled(tmp_path, monkeypatch) -> None:
+    from gateway.app import config as app_config
+    from gateway.app.steps import subtitles as subtitles_module
+    from gateway.app.core.workspace import Workspace
+    from gateway.app.providers.gemini_subtitles import GeminiSubtitlesError
+
+    monkeypatch.setenv("WORKSPACE_ROOT", str(tmp_path))
+    monkeypatch.setenv("SUBTITLES_SKIP_TRANSCRIBE", "1")
+    app_config.get_settings.cache_clear()
+
+    task_id = "subs_reuse_001"
+    raw = tmp_path / "tasks" / task_id / "raw" / "raw.mp4"
+    raw.parent.mkdir(parents=True, exist_ok=True)
+    raw.write_bytes(b"raw")
+    Workspace(task_id).write_origin_srt(
+        "1\n00:00:00,000 --> 00:00:01,200\nhello\n\n2\n00:00:01,200 --> 00:00:02,500\nworld\n"
+    )
+
+    def fail_extract(*_args, **_kwargs):
+        raise AssertionError("audio extraction should be skipped")
+
+    def fail_transcribe(*_args, **_kwargs):
+        raise AssertionError("transcription should be skipped")
+
+    def fake_translate(*_args, **_kwargs):
+        raise GeminiSubtitlesError("bad json")
+
+    monkeypatch.setattr(subtitles_module, "_extract_audio", fail_extract)
+    monkeypatch.setattr(subtitles_module, "_transcribe_with_faster_whisper", fail_transcribe)
+    monkeypatch.setattr(subtitles_module, "translate_segments_with_gemini", fake_translate)
+
+    result = asyncio.run(
+        subtitles_module.generate_subtitles(task_id=task_id, target_lang="my")
+    )
+
+    assert "hello" in result["origin_srt"]
+    assert "world" in result["origin_srt"]
+
+
+def test_openai_srt_writes_txt_from_memory(tmp_path) -> None:
+    from gateway.app.services import subtitles_openai
+
+    srt = tmp_path / "origin.srt"
+    subtitles_openai._write_srt(srt, "1\n00:00:00,000 --> 00:00:01,000\nhello\n")
+    assert srt.with_suffix(".txt").read_text(encoding="utf-8") == "hello\n"
+
+    srt.with_suffix(".txt").write_text("kept\n", encoding="utf-8")
+    subtitles_openai._ensure_txt_from_srt(srt)
+    assert srt.with_suffix(".txt").read_text(encoding="utf-8") == "kept\n"
+
+    srt.with_suffix(".txt").unlink()
+    subtitles_openai._ensure_txt_from_srt(srt)
+    assert srt.with_suffix(".txt").read_text(encoding="utf-8") == "hello\n"
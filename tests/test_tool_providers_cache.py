@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+
+def test_cached_tool_providers_reuses_result_until_cleared(monkeypatch) -> None:
+    from gateway.app.providers import registry
+
+    calls = {"count": 0}
+
+    def fake_resolve(_engine=None, _settings=None):
+        calls["count"] += 1
+        return {"tools": {"parse": {"provider": "xiongmao", "enabled": True}}}
+
+    monkeypatch.setenv("TOOL_PROVIDERS_CACHE_TTL_SEC", "60")
+    monkeypatch.setattr(registry, "resolve_tool_providers", fake_resolve)
+    registry.clear_tool_providers_cache()
+
+    first = registry.get_cached_tool_providers()
+    first["tools"]["parse"]["enabled"] = False
+    second = registry.get_cached_tool_providers()
+    assert second == {"tools": {"parse": {"provider": "xiongmao", "enabled": True}}}
+    assert calls["count"] == 1
+
+    registry.clear_tool_providers_cache()
+    registry.get_cached_tool_providers()
+    assert calls["count"] == 2
+    registry.clear_tool_providers_cache()
+
+
+def test_cached_tool_providers_keyed_by_settings(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from gateway.app.providers import registry
+
+    def fake_resolve(_engine=None, settings=None):
+        return {"tools": {"parse": {"provider": settings.name if settings else "default"}}}
+
+    monkeypatch.setenv("TOOL_PROVIDERS_CACHE_TTL_SEC", "60")
+    monkeypatch.setattr(registry, "resolve_tool_providers", fake_resolve)
+    registry.clear_tool_providers_cache()
+
+    first = registry.get_cached_tool_providers(settings=SimpleNamespace(name="a"))
+    second = registry.get_cached_tool_providers(settings=SimpleNamespace(name="b"))
+    assert first["tools"]["parse"]["provider"] == "a"
+    assert second["tools"]["parse"]["provider"] == "b"
+    registry.clear_tool_providers_cache()
+
+
+def test_cached_tool_handlers_follow_provider_cache(monkeypatch) -> None:
+    from gateway.app.providers import registry
+
+    provider = {"name": "xiongmao"}
+    calls = {"count": 0}
+
+    def fake_resolve(_engine=None, _settings=None):
+        calls["count"] += 1
+        return {"tools": {"parse": {"provider": provider["name"], "enabled": True}}}
+
+    monkeypatch.setenv("TOOL_PROVIDERS_CACHE_TTL_SEC", "60")
+    monkeypatch.setattr(registry, "resolve_tool_providers", fake_resolve)
+    registry.clear_tool_providers_cache()
+
+    handlers = registry.get_cached_tool_handlers()
+    registry.get_cached_tool_providers()
+    assert handlers["parse"] is registry.run_parse_step
+    assert handlers["pack"] is registry.run_pack_step
+    assert calls["count"] == 1
+
+    provider["name"] = "unknown"
+    assert "parse" in registry.get_cached_tool_handlers()
+    registry.clear_tool_providers_cache()
+    assert "parse" not in registry.get_cached_tool_handlers()
+    assert calls["count"] == 2
+    registry.clear_tool_providers_cache()
@@ -94,3 +94,19 @@ def test_create_capcut_pack_zip_structure(tmp_path, monkeypatch) -> None:
         },
     }
     assert result["files"] == expected
+
+
+def test_write_silence_wav_is_valid_pcm(tmp_path) -> None:
+    import wave
+
+    from gateway.app.services.pack_service import write_silence_wav
+
+    out = tmp_path / "audio" / "silence.wav"
+    write_silence_wav(out, seconds=1)
+
+    assert out.stat().st_size == 44 + 32000
+    with wave.open(str(out), "rb") as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getsampwidth() == 2
+        assert wav.getframerate() == 16000
+        assert wav.readframes(wav.getnframes()) == bytes(32000)
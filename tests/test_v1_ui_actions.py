@@ -9,3 +9,26 @@ def test_v1_actions_routes_exist():
     for path in paths:
         resp = client.post(path, json={})
         assert resp.status_code != 404, f"{path} is not registered"
+
+
+
+def test_v1_pack_returns_202_and_packs_in_background(monkeypatch):
+    from gateway.routes import v1_actions
+
+    updates = []
+    packed = []
+
+    async def fake_pack_step(req):
+        packed.append(req.task_id)
+
+    monkeypatch.setenv("RUN_STEPS_ASYNC", "1")
+    monkeypatch.setattr(v1_actions, "_update_task", lambda task_id, **fields: updates.append(fields))
+    monkeypatch.setattr(v1_actions, "run_pack_step", fake_pack_step)
+
+    with TestClient(app) as client:
+        resp = client.post("/v1/pack", json={"task_id": "demo_pack_async"})
+
+    assert resp.status_code == 202
+    assert resp.json()["status_url"] == "/v1/tasks/demo_pack_async/pack/status"
+    assert updates[0] == {"pack_status": "running", "pack_error": None}
+    assert packed == ["demo_pack_async"]